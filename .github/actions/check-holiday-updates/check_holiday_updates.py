@@ -6,13 +6,20 @@ directories and identifies files that may need updating based on configurable ag
 """
 
 import argparse
+import fnmatch
+import json
 import logging
 import os
+import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
     from github import Auth, Github
@@ -28,6 +35,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+CACHE_TTL_DAYS = 30
+GIT_LOG_CHUNK_SIZE = 65536
+GRAPHQL_BATCH_SIZE = 25
+GRAPHQL_SEARCH_PAGE_SIZE = 100
+ISSUE_TITLE_PREFIX = "Update required: "
+MAX_WORKERS = 16
+SECONDS_PER_DAY = 86400
+ISSUE_BODY_TEMPLATE_PATH = Path(__file__).parent / "issue_body_template.md"
+
+
+@lru_cache(maxsize=None)
+def load_issue_body_template() -> str:
+    """Load the issue body template, reading it from disk only once."""
+    with open(ISSUE_BODY_TEMPLATE_PATH, encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=4096)
+def _humanize_stem(stem: str) -> str:
+    """Convert a file stem to a title-cased name, memoized per stem."""
+    return stem.replace("_", " ").title()
+
 
 class HolidayUpdatesChecker:
     """Check holiday file updates and manage GitHub issues."""
@@ -40,6 +69,9 @@ class HolidayUpdatesChecker:
         github_token: Optional[str] = None,
         repository: str = "vacanza/holidays",
         threshold_days: int = 180,
+        commit_graph: bool = False,
+        jobs: int = MAX_WORKERS,
+        cache_file: Optional[str] = None,
     ):
         """
         Initialize the freshness checker.
@@ -51,44 +83,84 @@ class HolidayUpdatesChecker:
             github_token: GitHub token for API access
             repository: Repository where issues will be created (format: owner/repo)
             threshold_days: Days threshold for files (default: 180)
+            commit_graph: If True, write a commit-graph with changed-path
+                Bloom filters before scanning when the repository has none
+                (only single-path lookups use them, so off by default)
+            jobs: Maximum number of files checked concurrently
+            cache_file: Path to a JSON file persisting commit timestamps
+                between runs, invalidated by the commits made since (relative
+                paths are resolved against the repository root)
         """
         self.repo_path = Path(repo_path)
+        self._repo_prefix = os.path.join(str(self.repo_path), "")
         self.paths = paths
         self.threshold_days = threshold_days
         self.dry_run = dry_run
         self.repository = repository
+        self.commit_graph = commit_graph
+        self.jobs = jobs
+        self.cache_file = self.repo_path / cache_file if cache_file else None
+        self._mtime_cache: Dict[str, int] = {}
+        self._known_files: Set[Path] = set()
+        self._now_ts: Optional[int] = None
+        self._cache_created_at: Optional[int] = None
 
         self._configure_git_safe_directory()
 
         self.github: Optional[Github] = None
-        self.repo: Optional[Any] = None
-        if github_token and Github is not None and Auth is not None:
+        self._open_issues: Optional[Dict[str, int]] = None
+        if dry_run:
+            logger.debug("Dry run mode, GitHub integration disabled")
+        elif github_token and Github is not None and Auth is not None:
             try:
                 auth = Auth.Token(github_token)
                 self.github = Github(auth=auth)
-                self.repo = self.github.get_repo(self.repository)
             except Exception as e:
                 logger.warning(f"Failed to initialize GitHub client: {e}")
                 self.github = None
-                self.repo = None
         elif github_token and (Github is None or Auth is None):
             logger.warning("PyGithub not available, GitHub integration disabled")
 
+    @cached_property
+    def repo(self) -> Optional[Any]:
+        """Get the repository where issues are created, fetched on first use."""
+        if self.github is None:
+            return None
+
+        try:
+            return self.github.get_repo(self.repository)
+        except Exception as e:
+            logger.warning(f"Failed to get GitHub repository {self.repository}: {e}")
+            return None
+
+    def _run_git(
+        self, *args: str, input: Optional[str] = None, check: bool = False
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command in the repository and capture its output.
+
+        Args:
+            *args: Git subcommand and its arguments
+            input: Text to send to the command's stdin
+            check: If True, raise CalledProcessError on a non-zero exit code
+
+        Returns:
+            Completed process with text stdout/stderr
+        """
+        return subprocess.run(
+            ("git", *args),
+            cwd=self.repo_path,
+            input=input,
+            capture_output=True,
+            text=True,
+            check=check,
+        )
+
     def _configure_git_safe_directory(self) -> None:
         """Configure git to trust the workspace directory."""
         try:
-            safe_dir_result = subprocess.run(
-                (
-                    "git",
-                    "config",
-                    "--global",
-                    "--add",
-                    "safe.directory",
-                    str(self.repo_path),
-                ),
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+            safe_dir_result = self._run_git(
+                "config", "--global", "--add", "safe.directory", str(self.repo_path)
             )
             if safe_dir_result.returncode != 0:
                 logger.warning(
@@ -99,174 +171,542 @@ class HolidayUpdatesChecker:
         except Exception as e:
             logger.warning(f"Error configuring git safe directory: {e}")
 
-    def get_file_age_days(self, file_path: Path) -> int:
-        """Get file age in days since last commit."""
-        try:
-            relative_path = file_path.relative_to(self.repo_path)
+    def _write_commit_graph(self) -> None:
+        """
+        Write a commit-graph with changed-path Bloom filters if missing.
 
-            git_status = subprocess.run(
-                ("git", "status", "--porcelain"),
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+        Bloom filters let single-path `git log` lookups skip commits that
+        didn't touch the path without diffing their trees. The multi-path
+        `--stdin` walk of _build_mtime_index doesn't use them before git 2.51,
+        and writing the graph walks the full history, so this is opt-in.
+        """
+        objects_info = self.repo_path / ".git" / "objects" / "info"
+        if (objects_info / "commit-graph").exists() or (
+            objects_info / "commit-graphs"
+        ).exists():
+            return
+
+        try:
+            result = self._run_git(
+                "commit-graph", "write", "--reachable", "--changed-paths"
             )
-            if git_status.returncode != 0:
-                logger.error(
-                    f"Git repository not properly initialized: {git_status.stderr}"
-                )
-                raise RuntimeError(
-                    f"Git repository not accessible: {git_status.stderr}"
-                )
+        except OSError as e:
+            logger.warning(f"Failed to write commit-graph: {e}")
+            return
 
-            result = subprocess.run(
-                ("git", "log", "-1", "--format=%ct", "--", str(relative_path)),
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+        if result.returncode != 0:
+            logger.warning(f"Failed to write commit-graph: {result.stderr}")
+        else:
+            logger.debug("Wrote commit-graph with changed-path Bloom filters")
+
+    def _get_head(self) -> Optional[str]:
+        """Get the commit SHA of HEAD."""
+        try:
+            result = self._run_git("rev-parse", "HEAD", check=True)
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.warning(f"Failed to resolve HEAD: {e}")
+            return None
+
+        return result.stdout.strip()
+
+    def _get_changed_paths(self, since: str) -> Optional[Set[str]]:
+        """
+        Get paths touched by commits made after a given commit.
+
+        Args:
+            since: Commit SHA to list changes after
+
+        Returns:
+            Set of relative paths, or None if the commit isn't an ancestor of
+            HEAD (e.g. after a force-push) or the commit range can't be read
+        """
+        try:
+            ancestor = self._run_git("merge-base", "--is-ancestor", since, "HEAD")
+        except OSError as e:
+            logger.warning(f"Failed to list changes since {since}: {e}")
+            return None
+
+        if ancestor.returncode != 0:
+            logger.info(f"Cached commit {since} is not an ancestor of HEAD, ignoring")
+            return None
+
+        try:
+            result = self._run_git(
+                "log",
+                "--format=",
+                "--name-only",
+                "--no-renames",
+                "-z",
+                f"{since}..HEAD",
                 check=True,
             )
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.warning(f"Failed to list changes since {since}: {e}")
+            return None
 
-            if not result.stdout.strip():
-                raise RuntimeError(
-                    f"No git commit history found for file: {relative_path}"
-                )
+        return {path for path in result.stdout.split("\0") if path}
 
-            last_commit_timestamp = int(result.stdout.strip())
-            last_commit_date = datetime.fromtimestamp(last_commit_timestamp, tz=None)
-            current_time = datetime.now()
-            age = current_time - last_commit_date
+    def _load_timestamp_cache(self, head: str) -> None:
+        """
+        Seed commit timestamps from the cache file for untouched files.
 
-            return age.days
+        Timestamps of files touched by commits made since the cached run are
+        dropped, and the whole cache is discarded once it is older than
+        CACHE_TTL_DAYS so it is periodically rebuilt from history.
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error getting git commit date for {file_path}: {e}")
-            raise RuntimeError(
-                f"Failed to get git commit date for {file_path}: {e}"
-            ) from e
+        Args:
+            head: Current HEAD commit SHA
+        """
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                cache = json.load(f)
+            cached_head = cache["head"]
+            created_at = cache["created_at"]
+            timestamps = cache["timestamps"]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load timestamp cache {self.cache_file}: {e}")
+            return
+
+        def is_int(value: Any) -> bool:
+            return isinstance(value, int) and not isinstance(value, bool)
+
+        if not (
+            isinstance(cached_head, str)
+            and is_int(created_at)
+            and isinstance(timestamps, dict)
+            and all(is_int(timestamp) for timestamp in timestamps.values())
+        ):
+            logger.warning(f"Ignoring malformed timestamp cache {self.cache_file}")
+            return
+
+        now_ts = self._now_ts if self._now_ts is not None else int(time.time())
+        if now_ts - created_at > CACHE_TTL_DAYS * SECONDS_PER_DAY:
+            logger.info(
+                f"Timestamp cache is older than {CACHE_TTL_DAYS} days, ignoring"
+            )
+            return
+
+        changed_paths = (
+            set() if cached_head == head else self._get_changed_paths(cached_head)
+        )
+        if changed_paths is None:
+            return
+
+        for path, timestamp in timestamps.items():
+            if path not in changed_paths:
+                self._mtime_cache.setdefault(path, timestamp)
+        self._cache_created_at = created_at
+
+        logger.info(f"Loaded {len(self._mtime_cache)} cached commit timestamps")
+
+    def _save_timestamp_cache(self, head: str) -> None:
+        """
+        Persist known commit timestamps to the cache file.
+
+        Args:
+            head: Commit SHA the timestamps were computed at
+        """
+        created_at = self._cache_created_at
+        if created_at is None:
+            created_at = self._now_ts if self._now_ts is not None else int(time.time())
+        cache = {
+            "head": head,
+            "created_at": created_at,
+            "timestamps": dict(sorted(self._mtime_cache.items())),
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
         except OSError as e:
-            logger.error(f"Error accessing file {file_path}: {e}")
-            raise RuntimeError(f"Failed to access file {file_path}: {e}") from e
+            logger.warning(f"Failed to save timestamp cache {self.cache_file}: {e}")
 
-    def get_last_commit_date(self, file_path: Path) -> datetime:
-        """Get the last commit date for a file."""
+    def _build_mtime_index(self, file_paths: List[Path]) -> None:
+        """
+        Populate the commit timestamp cache with a single git log walk.
+
+        The walk output is consumed as it is produced and git is stopped as
+        soon as every requested file has been seen, so history older than the
+        oldest file's last commit is never traversed.
+
+        Args:
+            file_paths: List of file paths to index
+        """
+        if not file_paths:
+            return
+
+        try:
+            relative_paths = [self._relative_path(p) for p in file_paths]
+        except ValueError as e:
+            logger.warning(f"Failed to build commit timestamp index: {e}")
+            return
+        relative_paths = [p for p in relative_paths if p not in self._mtime_cache]
+        if not relative_paths:
+            return
+        remaining = set(relative_paths)
+
+        # Revision and paths are streamed over stdin so the query isn't
+        # bound by the command line length limit on large file sets.
+        # Rename detection is disabled as only the touched paths are needed.
+        query = "\n".join(("HEAD", "--", *relative_paths))
         try:
-            relative_path = file_path.relative_to(self.repo_path)
-            result = subprocess.run(
-                ("git", "log", "-1", "--format=%ct", "--", str(relative_path)),
+            process = subprocess.Popen(
+                (
+                    "git",
+                    "log",
+                    "--format=__C__%ct",
+                    "--name-only",
+                    "--no-renames",
+                    "-z",
+                    "--stdin",
+                ),
                 cwd=self.repo_path,
-                capture_output=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                check=True,
             )
+        except OSError as e:
+            logger.warning(f"Failed to build commit timestamp index: {e}")
+            return
 
-            if result.stdout.strip():
-                last_commit_timestamp = int(result.stdout.strip())
-                last_commit_date = datetime.fromtimestamp(last_commit_timestamp)
-
-                return last_commit_date
+        # Output is "__C__<ts>\0\n<path>\0<path>\0__C__<ts>\0..." newest first,
+        # so the first timestamp seen for a path is its last commit date.
+        with process:
+            try:
+                process.stdin.write(f"{query}\n")
+                process.stdin.close()
+            except OSError as e:
+                # git exited early (e.g. a bad revision); its exit code is
+                # reported below and unindexed files fall back to per-file
+                # lookups.
+                logger.warning(f"Failed to send paths to git log: {e}")
+                with suppress(OSError):
+                    process.stdin.close()
+
+            timestamp = None
+            pending = ""
+            while remaining and (chunk := process.stdout.read(GIT_LOG_CHUNK_SIZE)):
+                *tokens, pending = (pending + chunk).split("\0")
+                for token in tokens:
+                    token = token.lstrip("\n")
+                    if token.startswith("__C__"):
+                        timestamp = int(token[5:])
+                    elif token in remaining and timestamp is not None:
+                        self._mtime_cache[token] = timestamp
+                        remaining.discard(token)
+
+            if remaining:
+                process.wait()
+                if process.returncode != 0:
+                    logger.warning(
+                        "Failed to build commit timestamp index: "
+                        f"git log exited with code {process.returncode}"
+                    )
             else:
-                raise RuntimeError(
-                    f"No git commit history found for file: {relative_path}"
-                )
+                process.kill()
+
+        logger.debug(f"Indexed commit timestamps for {len(self._mtime_cache)} files")
+
+    def _relative_path(self, file_path: Path) -> str:
+        """Get a file path relative to the repository root as a string."""
+        path_str = str(file_path)
+        if path_str.startswith(self._repo_prefix):
+            return path_str[len(self._repo_prefix) :]
+        return str(file_path.relative_to(self.repo_path))
+
+    def _relative_dir(self, directory: Path) -> str:
+        """
+        Get a normalized, "/"-separated directory path relative to the root.
+
+        Components such as ".." are collapsed, as git pathspecs only match
+        normalized paths.
+        """
+        return os.path.normpath(self._relative_path(directory)).replace(os.sep, "/")
+
+    def _age_days(self, timestamp: int) -> int:
+        """Get the number of whole days elapsed since a Unix timestamp."""
+        now_ts = self._now_ts if self._now_ts is not None else int(time.time())
+        return (now_ts - timestamp) // SECONDS_PER_DAY
+
+    def _get_commit_timestamp(self, relative_path: str) -> int:
+        """
+        Get the last commit Unix timestamp for a file.
+
+        Args:
+            relative_path: File path relative to the repository root
+
+        Returns:
+            Last commit timestamp, memoized per path
+        """
+        if (timestamp := self._mtime_cache.get(relative_path)) is not None:
+            return timestamp
 
+        try:
+            result = self._run_git(
+                "log", "-1", "--format=%ct", "--", relative_path, check=True
+            )
         except subprocess.CalledProcessError as e:
-            logger.error(f"Error getting last commit date for {file_path}: {e}")
+            logger.error(
+                f"Error getting git commit date for {relative_path}: {e.stderr or e}"
+            )
             raise RuntimeError(
-                f"Failed to get git commit date for {file_path}: {e}"
+                f"Failed to get git commit date for {relative_path}: {e}"
             ) from e
         except OSError as e:
-            logger.error(f"Error accessing file {file_path}: {e}")
-            raise RuntimeError(f"Failed to access file {file_path}: {e}") from e
+            logger.error(f"Error accessing file {relative_path}: {e}")
+            raise RuntimeError(f"Failed to access file {relative_path}: {e}") from e
+
+        if not result.stdout.strip():
+            raise RuntimeError(f"No git commit history found for file: {relative_path}")
+
+        timestamp = int(result.stdout.strip())
+        self._mtime_cache[relative_path] = timestamp
+
+        return timestamp
+
+    def get_file_age_days(self, file_path: Path) -> int:
+        """Get file age in days since last commit."""
+        relative_path = self._relative_path(file_path)
+        return self._age_days(self._get_commit_timestamp(relative_path))
+
+    def get_last_commit_date(self, file_path: Path) -> datetime:
+        """Get the last commit date for a file."""
+        relative_path = self._relative_path(file_path)
+        return datetime.fromtimestamp(self._get_commit_timestamp(relative_path))
 
-    def extract_name_from_path(self, file_path: Path) -> str:
+    @staticmethod
+    def extract_name_from_path(file_path: Path) -> str:
         """Extract a human-readable name from file path."""
-        return file_path.stem.replace("_", " ").title()
+        return _humanize_stem(file_path.stem)
+
+    def _list_tracked_names(self, directory: Path) -> Optional[List[str]]:
+        """
+        List names of files tracked by git directly inside a directory.
+
+        The names are read from the git index rather than the filesystem.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            List of file names, or None if the git index can't be read
+        """
+        try:
+            relative_dir = self._relative_dir(directory)
+            result = self._run_git("ls-files", "-z", "--", f":(literal){relative_dir}")
+        except (ValueError, OSError):
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        prefix = "" if relative_dir == "." else f"{relative_dir}/"
+        names = (path[len(prefix) :] for path in result.stdout.split("\0") if path)
+        return [name for name in names if "/" not in name]
+
+    def _scan_dir(
+        self, directory: Path, patterns: List[Tuple[str, bool]]
+    ) -> List[Path]:
+        """
+        List regular files in a directory matching any of the patterns.
+
+        Tracked files are taken from the git index; the directory is listed
+        once with scandir when that isn't available (e.g. outside a git
+        checkout). Matched files are remembered so they don't need to be
+        stat'ed again when scanned.
+
+        Args:
+            directory: Directory to list
+            patterns: Shell-style name patterns, each paired with a flag
+                telling whether __init__.py files should be skipped
+
+        Returns:
+            List of matching file paths
+        """
+        matchers = [
+            (re.compile(fnmatch.translate(pattern)).match, skip_init)
+            for pattern, skip_init in patterns
+        ]
+
+        def is_match(name: str) -> bool:
+            return any(
+                match(name) and not (skip_init and name == "__init__.py")
+                for match, skip_init in matchers
+            )
+
+        tracked_names = self._list_tracked_names(directory)
+        if tracked_names is not None:
+            matching_files = [
+                directory / name for name in tracked_names if is_match(name)
+            ]
+        else:
+            try:
+                with os.scandir(directory) as entries:
+                    matching_files = [
+                        Path(entry.path)
+                        for entry in entries
+                        if is_match(entry.name) and entry.is_file()
+                    ]
+            except OSError:
+                return []
+
+        self._known_files.update(matching_files)
+        return matching_files
+
+    @staticmethod
+    def _has_wildcard(path_str: str) -> bool:
+        """Check whether a path string contains glob wildcards."""
+        return "*" in path_str or "?" in path_str
+
+    def _walk_dir(self, directory: Path, pattern: str) -> List[Path]:
+        """
+        Recursively list files matching a name pattern, as `<dir>/**/<pattern>`.
+
+        Tracked files are taken from the git index with a single `:(glob)`
+        pathspec; the directory is walked once with os.walk when that isn't
+        available (e.g. outside a git checkout).
+
+        Args:
+            directory: Directory to walk
+            pattern: Shell-style name pattern
+
+        Returns:
+            List of matching file paths
+        """
+        try:
+            relative_dir = self._relative_dir(directory)
+            glob_dir = "" if relative_dir == "." else f"{relative_dir}/"
+            result = self._run_git(
+                "ls-files", "-z", "--", f":(glob){glob_dir}**/{pattern}"
+            )
+        except (ValueError, OSError):
+            result = None
+
+        if result is not None and result.returncode == 0:
+            matching_files = [
+                self.repo_path / path for path in result.stdout.split("\0") if path
+            ]
+        else:
+            match = re.compile(fnmatch.translate(pattern)).match
+            matching_files = [
+                Path(root, name)
+                for root, _, names in os.walk(directory)
+                for name in names
+                if match(name)
+            ]
+
+        self._known_files.update(matching_files)
+        return matching_files
 
     def parse_paths(self, paths: List[str]) -> List[Path]:
         """
         Parse paths input into a list of file paths.
 
+        Patterns are grouped by directory so each directory is listed once.
+
         Args:
             paths: List of paths/globs
 
         Returns:
             List of file paths to check
         """
-        file_paths = []
-        path_list = [str(path).strip() for path in paths]
+        file_paths: Set[Path] = set()
+        patterns_by_dir: Dict[Path, List[Tuple[str, bool]]] = {}
 
-        for path_str in path_list:
+        for path_str in (str(path).strip() for path in paths):
             if not path_str:
                 continue
 
             path = Path(path_str)
+            if not path.is_absolute():
+                path = self.repo_path / path
 
             if "*" in path_str or "?" in path_str:
-                if not path.is_absolute():
-                    path = self.repo_path / path
-                matching_files = sorted(path.parent.glob(path.name))
-                file_paths.extend(matching_files)
-
-            elif path.is_dir() or (
-                not path.is_absolute() and (self.repo_path / path).is_dir()
-            ):
-                if not path.is_absolute():
-                    path = self.repo_path / path
-                python_files = sorted(path.glob("*.py"))
-                file_paths.extend(f for f in python_files if f.name != "__init__.py")
+                base = path.parent.parent
+                if path.parent.name == "**" and not self._has_wildcard(str(base)):
+                    file_paths.update(self._walk_dir(base, path.name))
+                elif self._has_wildcard(str(path.parent)):
+                    # Wildcards in directory parts (e.g. **) need a full glob.
+                    relative_pattern = str(path.relative_to(path.anchor))
+                    file_paths.update(Path(path.anchor).glob(relative_pattern))
+                else:
+                    patterns_by_dir.setdefault(path.parent, []).append(
+                        (path.name, False)
+                    )
+
+            elif path.is_dir():
+                patterns_by_dir.setdefault(path, []).append(("*.py", True))
+
+            elif path.suffix == ".py" and path.exists():
+                file_paths.add(path)
 
             else:
-                if not path.is_absolute():
-                    path = self.repo_path / path
+                logger.warning(f"File does not exist or is not a Python file: {path}")
 
-                if path.exists() and path.suffix == ".py":
-                    file_paths.append(path)
-                else:
-                    logger.warning(
-                        f"File does not exist or is not a Python file: {path}"
-                    )
+        for directory, patterns in patterns_by_dir.items():
+            file_paths.update(self._scan_dir(directory, patterns))
 
-        return sorted(set(file_paths), reverse=True)
+        return sorted(file_paths, reverse=True)
 
-    def scan_files(self, file_paths: List[Path], threshold_days: int) -> List[Dict]:
+    def _check_file(self, file_path: Path, threshold_days: int) -> Optional[Dict]:
         """
-        Scan a list of files for outdated files.
+        Check a single file against the age threshold.
 
         Args:
-            file_paths: List of file paths to check
+            file_path: File path to check
             threshold_days: Age threshold in days
 
         Returns:
-            List of dictionaries with file information
+            Dictionary with file information if outdated, None otherwise
         """
-        outdated_files: List[Dict] = []
+        if file_path not in self._known_files and not file_path.exists():
+            logger.warning(f"File does not exist: {file_path}")
+            return None
 
-        for file_path in file_paths:
-            if not file_path.exists():
-                logger.warning(f"File does not exist: {file_path}")
-                continue
+        if file_path.suffix != ".py":
+            logger.warning(f"File is not a Python file: {file_path}")
+            return None
 
-            if file_path.suffix != ".py":
-                logger.warning(f"File is not a Python file: {file_path}")
-                continue
+        relative_path = self._relative_path(file_path)
+        timestamp = self._get_commit_timestamp(relative_path)
+        age_days = self._age_days(timestamp)
+        if age_days <= threshold_days:
+            return None
 
-            age_days = self.get_file_age_days(file_path)
-            if age_days > threshold_days:
-                last_modified = self.get_last_commit_date(file_path)
-
-                file_info = {
-                    "path": str(file_path.relative_to(self.repo_path)),
-                    "name": self.extract_name_from_path(file_path),
-                    "age_days": age_days,
-                    "last_modified": last_modified.isoformat(),
-                    "threshold_days": threshold_days,
-                }
-                outdated_files.append(file_info)
-                logger.info(
-                    f"Outdated file found: {file_info['path']} ({age_days} days old)"
-                )
+        file_info = {
+            "path": relative_path,
+            "name": self.extract_name_from_path(file_path),
+            "age_days": age_days,
+            "last_modified": datetime.fromtimestamp(timestamp).isoformat(),
+            "threshold_days": threshold_days,
+        }
+        logger.info(f"Outdated file found: {file_info['path']} ({age_days} days old)")
 
-        return outdated_files
+        return file_info
+
+    def scan_files(self, file_paths: List[Path], threshold_days: int) -> List[Dict]:
+        """
+        Scan a list of files for outdated files.
+
+        Files are checked concurrently as git lookups are I/O bound; the
+        result order matches the input order.
+
+        Args:
+            file_paths: List of file paths to check
+            threshold_days: Age threshold in days
+
+        Returns:
+            List of dictionaries with file information
+        """
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = executor.map(
+                lambda file_path: self._check_file(file_path, threshold_days),
+                file_paths,
+            )
+            return [file_info for file_info in results if file_info is not None]
 
     def scan_directory(self, directory: Path, threshold_days: int) -> List[Dict]:
         """
@@ -285,27 +725,11 @@ class HolidayUpdatesChecker:
             logger.warning(f"Directory does not exist: {directory}")
             return outdated_files
 
-        all_files = sorted(directory.glob("*.py"))
-        python_files = (f for f in all_files if f.name != "__init__.py")
-
-        for file_path in python_files:
-            age_days = self.get_file_age_days(file_path)
-
-            if age_days > threshold_days:
-                last_modified = self.get_last_commit_date(file_path)
-                file_info = {
-                    "age_days": age_days,
-                    "last_modified": last_modified.isoformat(),
-                    "name": self.extract_name_from_path(file_path),
-                    "path": str(file_path.relative_to(self.repo_path)),
-                    "threshold_days": threshold_days,
-                }
-                outdated_files.append(file_info)
-                logger.info(
-                    f"Outdated file found: {file_info['path']} ({age_days} days old)"
-                )
+        python_files = sorted(self._scan_dir(directory, [("*.py", True)]))
+        self._now_ts = int(time.time())
+        self._build_mtime_index(python_files)
 
-        return outdated_files
+        return self.scan_files(python_files, threshold_days)
 
     def check_freshness(self) -> List[Dict]:
         """
@@ -321,23 +745,34 @@ class HolidayUpdatesChecker:
 
         logger.info(f"Found {len(file_paths)} files to check")
 
-        return self.scan_files(file_paths, self.threshold_days)
+        self._now_ts = int(time.time())
+        head = self._get_head() if self.cache_file else None
+        if head:
+            self._load_timestamp_cache(head)
+        if self.commit_graph:
+            self._write_commit_graph()
+        self._build_mtime_index(file_paths)
+
+        outdated_files = self.scan_files(file_paths, self.threshold_days)
+
+        if head:
+            self._save_timestamp_cache(head)
+
+        return outdated_files
 
     def create_issue_title(self, file_info: Dict) -> str:
         """Create a GitHub issue title for an outdated file."""
-        return f"Update required: {file_info['name']}"
+        return f"{ISSUE_TITLE_PREFIX}{file_info['name']}"
 
     def create_issue_body(self, file_info: Dict) -> str:
         """Create a GitHub issue body for an outdated file."""
         last_modified = datetime.fromisoformat(file_info["last_modified"])
         formatted_date = last_modified.strftime("%B %d, %Y")
 
-        template_path = Path(__file__).parent / "issue_body_template.md"
         try:
-            with open(template_path, encoding="utf-8") as f:
-                template = f.read()
+            template = load_issue_body_template()
         except FileNotFoundError:
-            logger.error(f"Template file not found: {template_path}")
+            logger.error(f"Template file not found: {ISSUE_BODY_TEMPLATE_PATH}")
             return f"File {file_info['path']} needs updating (last modified: {formatted_date})"
 
         return template.format(
@@ -348,18 +783,56 @@ class HolidayUpdatesChecker:
             name=file_info["name"],
         )
 
-    def find_existing_issue(self, file_info: Dict) -> Optional[Any]:
-        """Find existing open issue for a file."""
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """Normalize an issue title for lookups."""
+        return " ".join(title.split()).casefold()
+
+    def _get_open_issues(self) -> Dict[str, int]:
+        """
+        Get open update issues, fetching them only once.
+
+        A GraphQL search filters issues by title server-side and returns only
+        their titles and numbers, 100 per request. Issue numbers are indexed
+        by normalized title.
+        """
+        if self._open_issues is None:
+            search_query = (
+                f"repo:{self.repository} is:issue is:open "
+                f'in:title "{ISSUE_TITLE_PREFIX.rstrip(": ")}"'
+            )
+            query = (
+                "query($query: String!, $cursor: String) { "
+                f"search(query: $query, type: ISSUE, first: {GRAPHQL_SEARCH_PAGE_SIZE}, "
+                "after: $cursor) { pageInfo { hasNextPage endCursor } "
+                "nodes { ... on Issue { number title } } } }"
+            )
+            cursor = None
+            open_issues: Dict[str, int] = {}
+            while True:
+                _, response = self.github.requester.graphql_query(
+                    query, {"query": search_query, "cursor": cursor}
+                )
+                search = response["data"]["search"]
+                for node in search["nodes"]:
+                    if node:
+                        open_issues.setdefault(
+                            self._normalize_title(node["title"]), node["number"]
+                        )
+                if not search["pageInfo"]["hasNextPage"]:
+                    break
+                cursor = search["pageInfo"]["endCursor"]
+            self._open_issues = open_issues
+        return self._open_issues
+
+    def find_existing_issue(self, file_info: Dict) -> Optional[int]:
+        """Find existing open issue for a file and return its number."""
         if not self.repo:
             return None
 
         try:
-            title = self.create_issue_title(file_info)
-            issues = self.repo.get_issues(state="open")
-
-            for issue in issues:
-                if issue.title == title:
-                    return issue
+            title = self._normalize_title(self.create_issue_title(file_info))
+            return self._get_open_issues().get(title)
         except GithubException as e:
             logger.error(f"Error searching for existing issues: {e}")
 
@@ -378,7 +851,7 @@ class HolidayUpdatesChecker:
         existing_issue = self.find_existing_issue(file_info)
         if existing_issue:
             logger.info(
-                f"Existing issue found for {file_info['path']}: #{existing_issue.number}"
+                f"Existing issue found for {file_info['path']}: #{existing_issue}"
             )
             return True
 
@@ -387,6 +860,8 @@ class HolidayUpdatesChecker:
             body = self.create_issue_body(file_info)
 
             issue = self.repo.create_issue(title=title, body=body)
+            if self._open_issues is not None:
+                self._open_issues[self._normalize_title(title)] = issue.number
 
             logger.info(f"Created issue #{issue.number} for {file_info['path']}")
             return True
@@ -395,24 +870,122 @@ class HolidayUpdatesChecker:
 
         return False
 
+    def _batch_create_issues(self, file_infos: List[Dict]) -> Dict[str, int]:
+        """
+        Create GitHub issues using aliased GraphQL mutations.
+
+        Up to GRAPHQL_BATCH_SIZE issues are created per HTTP request. A failed
+        mutation doesn't undo the others in its batch, so results are counted
+        per alias, including when the response carries errors.
+
+        Args:
+            file_infos: List of outdated files without an existing issue
+
+        Returns:
+            Dictionary with counts of issues created and errors
+        """
+        stats = {"created": 0, "errors": 0}
+
+        for start in range(0, len(file_infos), GRAPHQL_BATCH_SIZE):
+            batch = file_infos[start : start + GRAPHQL_BATCH_SIZE]
+            params = ["$repositoryId: ID!"]
+            mutations = []
+            variables = {"repositoryId": self.repo.node_id}
+            for idx, file_info in enumerate(batch):
+                params.append(f"$title{idx}: String!, $body{idx}: String!")
+                mutations.append(
+                    f"i{idx}: createIssue(input: {{repositoryId: $repositoryId, "
+                    f"title: $title{idx}, body: $body{idx}}}) {{ issue {{ number }} }}"
+                )
+                variables[f"title{idx}"] = self.create_issue_title(file_info)
+                variables[f"body{idx}"] = self.create_issue_body(file_info)
+
+            query = f"mutation({', '.join(params)}) {{ {' '.join(mutations)} }}"
+            try:
+                _, response = self.github.requester.graphql_query(query, variables)
+            except GithubException as e:
+                # Raised when any alias failed; the data holds the others.
+                logger.error(f"Errors creating batch of {len(batch)} issues: {e}")
+                response = e.data if isinstance(e.data, dict) else {}
+
+            results = response.get("data") or {}
+            errors = {
+                error["path"][0]: error.get("message")
+                for error in response.get("errors") or []
+                if error.get("path")
+            }
+            for idx, file_info in enumerate(batch):
+                alias = f"i{idx}"
+                issue = (results.get(alias) or {}).get("issue")
+                if issue:
+                    logger.info(
+                        f"Created issue #{issue['number']} for {file_info['path']}"
+                    )
+                    stats["created"] += 1
+                else:
+                    logger.error(
+                        f"Failed to create issue for {file_info['path']}: "
+                        f"{errors.get(alias, 'no result returned')}"
+                    )
+                    stats["errors"] += 1
+
+        return stats
+
     def process_outdated_files(self, outdated_files: List[Dict]) -> Dict[str, int]:
         """
         Process outdated files and create GitHub issues.
 
+        Issue bodies are only rendered for issues that are actually created,
+        so dry runs and files with an existing issue skip template formatting.
+
         Returns:
             Dictionary with counts of issues created/updated
         """
         stats = {"created": 0, "skipped": 0, "errors": 0}
 
+        if self.dry_run or not self.repo:
+            for file_info in outdated_files:
+                try:
+                    if self.create_github_issue(file_info):
+                        stats["created"] += 1
+                    else:
+                        stats["errors"] += 1
+                except Exception as e:
+                    logger.error(f"Error processing {file_info['path']}: {e}")
+                    stats["errors"] += 1
+
+            return stats
+
+        pending_files: List[Dict] = []
+        pending_titles: Set[str] = set()
         for file_info in outdated_files:
             try:
-                if self.create_github_issue(file_info):
-                    stats["created"] += 1
-                else:
-                    stats["errors"] += 1
+                title = self._normalize_title(self.create_issue_title(file_info))
+                existing_issue = self.find_existing_issue(file_info)
             except Exception as e:
                 logger.error(f"Error processing {file_info['path']}: {e}")
                 stats["errors"] += 1
+                continue
+
+            if existing_issue:
+                logger.info(
+                    f"Existing issue found for {file_info['path']}: #{existing_issue}"
+                )
+                stats["created"] += 1
+            elif title in pending_titles:
+                logger.info(f"Issue already pending for {file_info['path']}")
+                stats["created"] += 1
+            else:
+                pending_files.append(file_info)
+                pending_titles.add(title)
+
+        try:
+            batch_stats = self._batch_create_issues(pending_files)
+            stats["created"] += batch_stats["created"]
+            stats["errors"] += batch_stats["errors"]
+        except Exception as e:
+            logger.error(f"Error creating issues: {e}")
+            stats["errors"] += len(pending_files)
 
         return stats
 
@@ -432,11 +1005,19 @@ class HolidayUpdatesChecker:
         }
 
 
-def write_github_output(output_name: str, value: str) -> None:
-    """Write output to GitHub Actions output file."""
+def write_github_outputs(outputs: Dict[str, str]) -> None:
+    """Write outputs to GitHub Actions output file."""
     if output_file := os.getenv("GITHUB_OUTPUT"):
         with open(output_file, "a", encoding="utf-8") as f:
-            f.write(f"{output_name}={value}\n")
+            f.write("".join(f"{name}={value}\n" for name, value in outputs.items()))
+
+
+def positive_int(value: str) -> int:
+    """Parse a command line value as an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def parse_args():
@@ -469,6 +1050,24 @@ def parse_args():
         default=180,
         help="Age threshold for files in days",
     )
+    parser.add_argument(
+        "--commit-graph",
+        type=str,
+        default="false",
+        help="Write a commit-graph with Bloom filters for single-path git log",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=MAX_WORKERS,
+        help="Maximum number of files checked concurrently",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=str,
+        default="",
+        help="JSON file used to persist commit timestamps between runs",
+    )
     return parser.parse_args()
 
 
@@ -483,6 +1082,7 @@ def main():
     github_token = args.github_token or os.getenv("GITHUB_TOKEN")
     repository = args.repository
     dry_run = args.dry_run.lower() == "true"
+    commit_graph = args.commit_graph.lower() == "true"
 
     if not os.path.exists(repo_path) or not (Path(repo_path) / ".git").exists():
         logger.error(f"Git repository does not exist: {repo_path}")
@@ -495,22 +1095,33 @@ def main():
         github_token=github_token,
         repository=repository,
         threshold_days=threshold_days,
+        commit_graph=commit_graph,
+        jobs=args.jobs,
+        cache_file=args.cache_file or None,
     )
 
     result = checker.run()
 
-    write_github_output("issues_created_count", str(result["stats"]["created"]))
-    write_github_output("outdated_files_count", str(len(result["outdated_files"])))
-
-    print("📊 Summary:")
-    print(f"  • Outdated files found: {len(result['outdated_files'])}")
-    print(f"  • Issues created: {result['stats']['created']}")
-    print(f"  • Errors: {result['stats']['errors']}")
+    write_github_outputs(
+        {
+            "issues_created_count": str(result["stats"]["created"]),
+            "outdated_files_count": str(len(result["outdated_files"])),
+        }
+    )
 
+    summary = [
+        "📊 Summary:",
+        f"  • Outdated files found: {len(result['outdated_files'])}",
+        f"  • Issues created: {result['stats']['created']}",
+        f"  • Errors: {result['stats']['errors']}",
+    ]
     if result["outdated_files"]:
-        print("\n📁 Outdated files:")
-        for file_info in result["outdated_files"]:
-            print(f"  • {file_info['path']} ({file_info['age_days']} days old)")
+        summary.append("\n📁 Outdated files:")
+        summary.extend(
+            f"  • {file_info['path']} ({file_info['age_days']} days old)"
+            for file_info in result["outdated_files"]
+        )
+    sys.stdout.write("\n".join(summary) + "\n")
 
     if result["stats"]["errors"] > 0:
         sys.exit(1)
@@ -3,16 +3,25 @@
 Fetch monthly download statistics for the holidays package from pepy.tech API.
 """
 
+import bisect
 import json
 import logging
 import os
 import sys
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -23,6 +32,35 @@ OUTPUT_FILE = Path("badges/downloads/pepy.tech.yaml")
 PACKAGE_NAME = "holidays"
 API_URL = "https://api.pepy.tech/api/v2/projects/holidays"
 
+# Largest unit first; each unit is 1000 times the next one.
+HUMANIZE_SCALES = ((10**9, "B"), (10**6, "M"), (10**3, "K"))
+
+# Prefer the libyaml-backed dumper; the pure Python one is much slower.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Output fields that change on every run regardless of the download data.
+VOLATILE_FIELDS = frozenset({"updated_at"})
+
+
+def create_session() -> requests.Session:
+    """Create an HTTP session that keeps connections alive and retries on errors."""
+    retry = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+    http_session = requests.Session()
+    http_session.headers.update(
+        {"Accept-Encoding": "gzip", "Content-Type": "application/json"}
+    )
+    http_session.mount("https://", adapter)
+    return http_session
+
+
+session = create_session()
+
 
 def fetch_download_data() -> Optional[Dict[str, Any]]:
     """Fetch download data from pepy.tech API with authentication."""
@@ -34,12 +72,11 @@ def fetch_download_data() -> Optional[Dict[str, Any]]:
 
         logger.info(f"Fetching download data from {API_URL}")
 
-        headers = {"X-API-Key": api_key, "Content-Type": "application/json"}
-
-        response = requests.get(API_URL, headers=headers, timeout=30)
+        response = session.get(API_URL, headers={"X-API-Key": api_key}, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        # orjson decodes large payloads faster; its errors subclass JSONDecodeError.
+        data = orjson.loads(response.content) if orjson else response.json()
         logger.info("Successfully fetched download data")
         return data
 
@@ -51,10 +88,21 @@ def fetch_download_data() -> Optional[Dict[str, Any]]:
         return None
 
 
+def format_iso_date(value: datetime) -> str:
+    """Format a date as YYYY-MM-DD without going through strftime."""
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
 def get_previous_month_dates():
     """Get the start and end dates of the previous complete month."""
     now = datetime.now(timezone.utc)
     first_current_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return _get_month_before(first_current_month)
+
+
+@lru_cache(maxsize=1)
+def _get_month_before(first_current_month: datetime) -> Tuple[datetime, datetime]:
+    """Get the first and last day of the month preceding the given month start."""
     last_previous_month = first_current_month - timedelta(days=1)
     first_previous_month = last_previous_month.replace(day=1)
     return first_previous_month, last_previous_month
@@ -76,68 +124,73 @@ def get_last_7_days_dates():
     return start_date, end_date
 
 
-def extract_monthly_downloads(data: Dict[str, Any]) -> Optional[int]:
-    """Extract download count for the previous complete month only."""
+@lru_cache(maxsize=None)
+def is_iso_date(date_str: str) -> bool:
+    """Check whether a date key is a valid YYYY-MM-DD date, caching the result."""
+    if not (
+        len(date_str) == 10
+        and date_str[4] == date_str[7] == "-"
+        and date_str.isascii()
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    ):
+        return False
+
     try:
-        logger.info(f"Processing API response with keys: {list(data.keys())}")
+        date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    except ValueError:  # Out of range month or day.
+        return False
 
-        if "downloads" not in data:
-            logger.error("No 'downloads' key found in API response")
-            return None
+    return True
 
-        downloads = data["downloads"]
-        if not isinstance(downloads, dict):
-            logger.error("'downloads' is not a dictionary")
-            return None
 
-        start_date, end_date = get_previous_month_dates()
-        logger.info(
-            "Calculating downloads for previous month: "
-            f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        )
+def get_daily_total(version_data: Dict[str, Any]) -> int:
+    """Sum the per-version download counts of a single day."""
+    # The API returns integer counts, so try summing without per-value checks.
+    try:
+        total = sum(version_data.values())
+    except TypeError:
+        total = None
+    if isinstance(total, int):
+        return total
+
+    return sum(
+        int(value) for value in version_data.values() if isinstance(value, (int, float))
+    )
 
-        previous_month_downloads = 0
-        processed_dates = []
-
-        for date_str, version_data in downloads.items():
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc
-                )
-                if start_date <= date_obj <= end_date:
-                    if isinstance(version_data, dict):
-                        daily_total = sum(
-                            int(value)
-                            for value in version_data.values()
-                            if isinstance(value, (int, float))
-                        )
-                        previous_month_downloads += daily_total
-                        processed_dates.append(date_str)
-            except ValueError as e:
-                logger.warning(f"Could not parse date '{date_str}': {e}")
-                continue
 
-        logger.info(f"Processed {len(processed_dates)} days from previous month")
-        logger.info(f"Previous month total downloads: {previous_month_downloads}")
+def get_dates_in_range(
+    downloads: Dict[str, Any], start_str: str, end_str: str
+) -> List[str]:
+    """Get the date keys between two ISO dates (inclusive) using binary search."""
+    dates = sorted(downloads)
+    start = bisect.bisect_left(dates, start_str)
+    end = bisect.bisect_right(dates, end_str, lo=start)
+    return dates[start:end]
 
-        if len(processed_dates) == 0:
-            logger.warning("No data found for the previous month")
-            return None
 
-        return previous_month_downloads
+def _extract_downloads(
+    data: Dict[str, Any], periods: List[Tuple[str, datetime, datetime]]
+) -> Optional[List[int]]:
+    """
+    Extract download counts for one or more date ranges (inclusive).
 
-    except Exception as e:
-        logger.error(f"Error extracting monthly downloads: {e}")
-        return None
+    The dates spanning all periods are walked once, so each day's total is
+    computed a single time even where the periods overlap.
 
+    Args:
+        data: API response data
+        periods: Period names with their start and end dates
 
-def extract_date_range_downloads(
-    data: Dict[str, Any], start_date: datetime, end_date: datetime, period_name: str
-) -> Optional[int]:
-    """Extract download count for a specified date range."""
+    Returns:
+        Download totals in the order of the periods, or None if any period
+        has no data
+    """
+    period_names = ", ".join(period_name for period_name, _, _ in periods)
     try:
         logger.info(
-            f"Processing API response for {period_name} with keys: {list(data.keys())}"
+            f"Processing API response for {period_names} with keys: {list(data.keys())}"
         )
 
         if "downloads" not in data:
@@ -149,46 +202,62 @@ def extract_date_range_downloads(
             logger.error("'downloads' is not a dictionary")
             return None
 
-        logger.info(
-            f"Calculating downloads for {period_name}: "
-            f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        )
-
-        total_downloads = 0
-        processed_dates = []
-
-        for date_str, version_data in downloads.items():
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc
-                )
-                if start_date <= date_obj <= end_date:
-                    if isinstance(version_data, dict):
-                        daily_total = sum(
-                            int(value)
-                            for value in version_data.values()
-                            if isinstance(value, (int, float))
-                        )
-                        total_downloads += daily_total
-                        processed_dates.append(date_str)
-            except ValueError as e:
-                logger.warning(f"Could not parse date '{date_str}': {e}")
+        bounds = [
+            (format_iso_date(start_date), format_iso_date(end_date))
+            for _, start_date, end_date in periods
+        ]
+        totals = [0] * len(periods)
+        processed_days = [0] * len(periods)
+
+        # ISO dates sort lexicographically, so only in-window keys are parsed.
+        first_str = min(start_str for start_str, _ in bounds)
+        last_str = max(end_str for _, end_str in bounds)
+        for date_str in get_dates_in_range(downloads, first_str, last_str):
+            version_data = downloads[date_str]
+            if not is_iso_date(date_str):
+                logger.warning(f"Skipping invalid date '{date_str}'")
+                continue
+            if not isinstance(version_data, dict):
                 continue
 
-        logger.info(f"Processed {len(processed_dates)} days from {period_name}")
-        logger.info(f"{period_name} total downloads: {total_downloads}")
-
-        if len(processed_dates) == 0:
-            logger.warning(f"No data found for the {period_name}")
-            return None
-
-        return total_downloads
+            daily_total = get_daily_total(version_data)
+            for idx, (start_str, end_str) in enumerate(bounds):
+                if start_str <= date_str <= end_str:
+                    totals[idx] += daily_total
+                    processed_days[idx] += 1
+
+        for (period_name, _, _), (start_str, end_str), total, days in zip(
+            periods, bounds, totals, processed_days
+        ):
+            logger.info(
+                f"Processed {days} days from {period_name} ({start_str} to {end_str})"
+            )
+            if days == 0:
+                logger.warning(f"No data found for the {period_name}")
+                return None
+            logger.info(f"{period_name} total downloads: {total}")
+
+        return totals
 
     except Exception as e:
-        logger.error(f"Error extracting {period_name} downloads: {e}")
+        logger.error(f"Error extracting {period_names} downloads: {e}")
         return None
 
 
+def extract_date_range_downloads(
+    data: Dict[str, Any], start_date: datetime, end_date: datetime, period_name: str
+) -> Optional[int]:
+    """Extract download count for a specified date range."""
+    totals = _extract_downloads(data, [(period_name, start_date, end_date)])
+    return totals[0] if totals else None
+
+
+def extract_monthly_downloads(data: Dict[str, Any]) -> Optional[int]:
+    """Extract download count for the previous complete month only."""
+    start_date, end_date = get_previous_month_dates()
+    return extract_date_range_downloads(data, start_date, end_date, "previous month")
+
+
 def extract_latest_7_days_downloads(data: Dict[str, Any]) -> Optional[int]:
     """Extract download count for the latest 7 days."""
     start_date, end_date = get_last_7_days_dates()
@@ -201,36 +270,40 @@ def extract_latest_30_days_downloads(data: Dict[str, Any]) -> Optional[int]:
     return extract_date_range_downloads(data, start_date, end_date, "latest 30 days")
 
 
+def extract_period_downloads(data: Dict[str, Any]) -> Optional[Tuple[int, int, int]]:
+    """
+    Extract download counts for the previous month, latest 30 and 7 days.
+
+    Returns:
+        Tuple of previous month, latest 30 days and latest 7 days downloads,
+        or None if any period has no data
+    """
+    totals = _extract_downloads(
+        data,
+        [
+            ("previous month", *get_previous_month_dates()),
+            ("latest 30 days", *get_last_30_days_dates()),
+            ("latest 7 days", *get_last_7_days_dates()),
+        ],
+    )
+    if totals is None:
+        return None
+
+    monthly_downloads, latest_30_days_downloads, latest_7_days_downloads = totals
+    return monthly_downloads, latest_30_days_downloads, latest_7_days_downloads
+
+
 def humanize_number(value: int) -> str:
     """Convert a number to human-readable format with K/M/B suffixes, rounded to full units."""
-    if value < 1000:
-        return str(value)
-
-    # Round to nearest thousand, million, billion, etc.
-    if value < 1000000:
-        # Round to nearest thousand
-        rounded = round(value / 1000)
-        if rounded == 0:
-            return "1K"
-        # If rounding to 1000K, convert to 1M
-        if rounded >= 1000:
-            return "1M"
-        return f"{rounded}K"
-    elif value < 1000000000:
-        # Round to nearest million
-        rounded = round(value / 1000000)
-        if rounded == 0:
-            return "1M"
-        # If rounding to 1000M, convert to 1B
-        if rounded >= 1000:
-            return "1B"
-        return f"{rounded}M"
-    else:
-        # Round to nearest billion
-        rounded = round(value / 1000000000)
-        if rounded == 0:
-            return "1B"
-        return f"{rounded}B"
+    for index, (threshold, suffix) in enumerate(HUMANIZE_SCALES):
+        if value >= threshold:
+            rounded = round(value / threshold)
+            # If rounding to 1000K or 1000M, promote to the next larger unit.
+            if rounded >= 1000 and index > 0:
+                return f"1{HUMANIZE_SCALES[index - 1][1]}"
+            return f"{rounded}{suffix}"
+
+    return str(value)
 
 
 def create_output_data(
@@ -241,29 +314,24 @@ def create_output_data(
 ) -> Dict[str, Any]:
     """Create the output data structure with enhanced information from API v2."""
     first_previous_month, last_previous_month = get_previous_month_dates()
-    start_30_days, end_30_days = get_last_30_days_dates()
 
     output_data = {
         "package": f"https://pypi.org/project/{PACKAGE_NAME}",
         "source": "https://pepy.tech/pepy-api",
     }
 
+    # ISO dates compare lexicographically, so max() finds the latest in one pass
+    downloads = api_data.get("downloads")
+    most_recent_date = max(downloads) if downloads else None
+
     # Group daily downloads values together (raw + human)
-    if "downloads" in api_data:
-        dates = list(api_data["downloads"].keys())
-        if dates:
-            dates.sort(reverse=True)
-            most_recent_date = dates[0]
-            recent_data = api_data["downloads"][most_recent_date]
-            if isinstance(recent_data, dict):
-                recent_total = sum(
-                    int(value)
-                    for value in recent_data.values()
-                    if isinstance(value, (int, float))
-                )
-                # Group daily downloads values together
-                output_data["last_1d_downloads"] = recent_total
-                output_data["last_1d_downloads_human"] = humanize_number(recent_total)
+    if most_recent_date is not None:
+        recent_data = downloads[most_recent_date]
+        if isinstance(recent_data, dict):
+            recent_total = get_daily_total(recent_data)
+            # Group daily downloads values together
+            output_data["last_1d_downloads"] = recent_total
+            output_data["last_1d_downloads_human"] = humanize_number(recent_total)
 
     # Group latest 7 days downloads values together (raw + human)
     output_data["last_7d_downloads"] = latest_7_days_downloads
@@ -279,8 +347,8 @@ def create_output_data(
 
     # Add previous month reporting period
     output_data["previous_month_reporting_period"] = {
-        "start_date": first_previous_month.strftime("%Y-%m-%d"),
-        "end_date": last_previous_month.strftime("%Y-%m-%d"),
+        "start_date": format_iso_date(first_previous_month),
+        "end_date": format_iso_date(last_previous_month),
     }
 
     # Group total downloads values together (raw + human)
@@ -293,22 +361,47 @@ def create_output_data(
     output_data["updated_at"] = datetime.now(timezone.utc).isoformat()
 
     # Add data date at the very end
-    if "downloads" in api_data:
-        dates = list(api_data["downloads"].keys())
-        if dates:
-            dates.sort(reverse=True)
-            most_recent_date = dates[0]
-            output_data["updated_data_date"] = most_recent_date
+    if most_recent_date is not None:
+        output_data["updated_data_date"] = most_recent_date
 
     return output_data
 
 
+def is_output_unchanged(data: Dict[str, Any]) -> bool:
+    """Check whether the output file already holds the same download data."""
+    try:
+        with open(OUTPUT_FILE, encoding="utf-8") as f:
+            existing_data = yaml.load(f, Loader=YAML_LOADER)
+    except (OSError, yaml.YAMLError):
+        return False
+
+    if not isinstance(existing_data, dict):
+        return False
+
+    def stable_fields(output_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in output_data.items() if k not in VOLATILE_FIELDS}
+
+    return stable_fields(existing_data) == stable_fields(data)
+
+
 def save_yaml_data(data: Dict[str, Any]) -> bool:
-    """Save data to YAML file."""
+    """Save data to YAML file, leaving it untouched if the data is unchanged."""
     try:
+        if is_output_unchanged(data):
+            logger.info(f"Download data unchanged, keeping {OUTPUT_FILE}")
+            return True
+
+        if YAML_DUMPER is yaml.SafeDumper:
+            logger.warning("libyaml is not available, using pure Python YAML dumper")
         OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
         with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                data,
+                f,
+                Dumper=YAML_DUMPER,
+                default_flow_style=False,
+                sort_keys=False,
+            )
         logger.info(f"Successfully saved data to {OUTPUT_FILE}")
         return True
     except Exception as e:
@@ -325,20 +418,14 @@ def main() -> int:
         logger.error("Failed to fetch data from API")
         return 1
 
-    monthly_downloads = extract_monthly_downloads(api_data)
-    if monthly_downloads is None:
-        logger.error("Failed to extract monthly downloads from API response")
+    period_downloads = extract_period_downloads(api_data)
+    if period_downloads is None:
+        logger.error("Failed to extract download counts from API response")
         return 1
 
-    latest_30_days_downloads = extract_latest_30_days_downloads(api_data)
-    if latest_30_days_downloads is None:
-        logger.error("Failed to extract latest 30 days downloads from API response")
-        return 1
-
-    latest_7_days_downloads = extract_latest_7_days_downloads(api_data)
-    if latest_7_days_downloads is None:
-        logger.error("Failed to extract latest 7 days downloads from API response")
-        return 1
+    monthly_downloads, latest_30_days_downloads, latest_7_days_downloads = (
+        period_downloads
+    )
 
     logger.info(f"Extracted monthly downloads: {monthly_downloads}")
     logger.info(f"Extracted latest 30 days downloads: {latest_30_days_downloads}")
@@ -1,13 +1,20 @@
 """Tests for check-holiday-updates action."""
 
+import io
+import json
 import os
+import re
+import shutil
+import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+import yaml
 
 # Add the action directory to sys.path for imports
 sys_path = os.path.join(
@@ -15,19 +22,48 @@ sys_path = os.path.join(
 )
 sys.path.insert(0, sys_path)
 
-from check_holiday_updates import HolidayUpdatesChecker  # noqa: E402
+from check_holiday_updates import (  # noqa: E402
+    HolidayUpdatesChecker,
+    load_issue_body_template,
+    main,
+    parse_args,
+    write_github_outputs,
+)
+
+
+def search_response(nodes, end_cursor=None):
+    """Build a GraphQL issue search response."""
+    return {
+        "data": {
+            "search": {
+                "pageInfo": {
+                    "hasNextPage": end_cursor is not None,
+                    "endCursor": end_cursor,
+                },
+                "nodes": nodes,
+            }
+        }
+    }
+
+
+@pytest.fixture(scope="class")
+def class_temp_dir():
+    """Create one temporary directory shared by all tests in a class."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 class TestHolidayUpdatesChecker:
     """Test cases for HolidayUpdatesChecker class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.repo_path = Path(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def setup_checker(self, class_temp_dir):
+        """Set up test fixtures in a fresh subdirectory of the class directory."""
+        self.repo_path = Path(tempfile.mkdtemp(dir=class_temp_dir))
         self.paths_dir = self.repo_path / "holidays"
 
-        self.paths_dir.mkdir(parents=True)
+        self.paths_dir.mkdir()
 
         self.checker = HolidayUpdatesChecker(
             repo_path=str(self.repo_path),
@@ -37,12 +73,6 @@ class TestHolidayUpdatesChecker:
             repository="test/repo",
         )
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
     def test_init_default_values(self):
         """Test initialization with default values."""
         checker = HolidayUpdatesChecker(
@@ -52,6 +82,7 @@ class TestHolidayUpdatesChecker:
         assert checker.paths == ["holidays"]
         assert checker.threshold_days == 180
         assert checker.dry_run is False
+        assert checker.commit_graph is False
         assert checker.github is None
         assert checker.repo is None
 
@@ -68,6 +99,9 @@ class TestHolidayUpdatesChecker:
         assert checker.paths == ["custom/holidays"]
         assert checker.threshold_days == 90
         assert checker.dry_run is True
+        # No GitHub client is needed in dry run mode.
+        assert checker.github is None
+        assert checker.repo is None
 
     @patch("check_holiday_updates.Auth")
     @patch("check_holiday_updates.Github")
@@ -111,17 +145,13 @@ class TestHolidayUpdatesChecker:
     @patch("check_holiday_updates.subprocess.run")
     def test_get_file_age_days(self, mock_subprocess):
         """Test getting file age in days."""
-        # Mock git status command
-        mock_status = Mock()
-        mock_status.returncode = 0
-        mock_status.stderr = ""
-
         # Mock git log command
-        mock_log = Mock()
-        mock_log.returncode = 0
-        mock_log.stdout = str(int((datetime.now() - timedelta(days=5)).timestamp()))
-
-        mock_subprocess.side_effect = [mock_status, mock_log]
+        timestamp = int((datetime.now() - timedelta(days=5)).timestamp())
+        mock_subprocess.side_effect = [
+            subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=str(timestamp), stderr=""
+            )
+        ]
 
         test_file = self.repo_path / "test_file.py"
         test_file.write_text("# Test file")
@@ -129,47 +159,357 @@ class TestHolidayUpdatesChecker:
         age = self.checker.get_file_age_days(test_file)
         assert age == 5
 
-    @patch("check_holiday_updates.subprocess.run")
-    def test_get_file_age_days_nonexistent(self, mock_subprocess):
-        """Test getting age for nonexistent file."""
-        # Mock git status command
-        mock_status = Mock()
-        mock_status.returncode = 0
-        mock_status.stderr = ""
+        # The timestamp is memoized for the subsequent commit date lookup.
+        self.checker.get_last_commit_date(test_file)
+        assert mock_subprocess.call_count == 1
 
-        # Mock git log commands to return empty (no commits)
-        mock_log1 = Mock()
-        mock_log1.returncode = 0
-        mock_log1.stdout = ""
+    @patch("check_holiday_updates.subprocess.run")
+    def test_get_file_age_days_git_error(self, mock_subprocess):
+        """Test a failing git log is reported without a separate repo check."""
+        mock_subprocess.side_effect = subprocess.CalledProcessError(
+            128, ["git", "log"], stderr="fatal: not a git repository"
+        )
 
-        mock_log2 = Mock()
-        mock_log2.returncode = 0
-        mock_log2.stdout = ""
+        with pytest.raises(RuntimeError, match="Failed to get git commit date"):
+            self.checker.get_file_age_days(self.repo_path / "a.py")
 
-        mock_log3 = Mock()
-        mock_log3.returncode = 0
-        mock_log3.stdout = ""
+        mock_subprocess.assert_called_once()
+        assert mock_subprocess.call_args.args[0][:2] == ("git", "log")
 
-        mock_subprocess.side_effect = [mock_status, mock_log1, mock_log2, mock_log3]
+    @patch("check_holiday_updates.subprocess.run")
+    def test_get_file_age_days_nonexistent(self, mock_subprocess):
+        """Test getting age for nonexistent file."""
+        # Mock git log command to return empty (no commits)
+        mock_subprocess.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
 
         nonexistent_file = self.repo_path / "nonexistent.py"
 
         with pytest.raises(RuntimeError, match="No git commit history found"):
             self.checker.get_file_age_days(nonexistent_file)
 
-    def test_extract_name_from_path(self):
-        """Test extracting human-readable name from file path."""
-        test_cases = [
+    @patch("check_holiday_updates.subprocess.Popen")
+    def test_build_mtime_index(self, mock_popen):
+        """Test indexing commit timestamps with a single git log call."""
+        old_ts = int((datetime.now() - timedelta(days=200)).timestamp())
+        new_ts = int((datetime.now() - timedelta(days=5)).timestamp())
+
+        mock_process = mock_popen.return_value
+        mock_process.stdout = io.StringIO(
+            f"__C__{new_ts}\0\nholidays/a.py\0"
+            f"__C__{old_ts}\0\nholidays/a.py\0holidays/b.py\0"
+            f"__C__{old_ts - 100}\0\nholidays/b.py\0"
+        )
+
+        file_a = self.paths_dir / "a.py"
+        file_b = self.paths_dir / "b.py"
+        with patch("check_holiday_updates.subprocess.run") as mock_subprocess:
+            self.checker._build_mtime_index([file_a, file_b])
+
+            assert mock_popen.call_count == 1
+            assert "--stdin" in mock_popen.call_args.args[0]
+            mock_process.stdin.write.assert_called_once_with(
+                "HEAD\n--\nholidays/a.py\nholidays/b.py\n"
+            )
+            assert self.checker._mtime_cache == {
+                "holidays/a.py": new_ts,
+                "holidays/b.py": old_ts,
+            }
+            # The walk is stopped once every file has been seen.
+            mock_process.kill.assert_called_once()
+
+            assert self.checker.get_file_age_days(file_a) == 5
+            assert self.checker.get_file_age_days(file_b) == 200
+            assert self.checker.get_last_commit_date(file_b) == datetime.fromtimestamp(
+                old_ts
+            )
+            mock_subprocess.assert_not_called()
+
+    @patch("check_holiday_updates.subprocess.Popen")
+    def test_build_mtime_index_broken_pipe(self, mock_popen):
+        """Test git exiting before reading the paths doesn't abort the scan."""
+        mock_process = mock_popen.return_value
+        mock_process.stdin.write.side_effect = BrokenPipeError
+        mock_process.stdin.close.side_effect = BrokenPipeError
+        mock_process.stdout = io.StringIO("")
+        mock_process.returncode = 128
+
+        self.checker._build_mtime_index([self.paths_dir / "a.py"])
+
+        assert self.checker._mtime_cache == {}
+        mock_process.wait.assert_called_once()
+
+    @patch("check_holiday_updates.subprocess.run")
+    def test_write_commit_graph(self, mock_subprocess):
+        """Test a commit-graph is written only when missing."""
+        mock_subprocess.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+
+        self.checker._write_commit_graph()
+
+        mock_subprocess.assert_called_once()
+        assert mock_subprocess.call_args.args[0] == (
+            "git",
+            "commit-graph",
+            "write",
+            "--reachable",
+            "--changed-paths",
+        )
+
+        objects_info = self.repo_path / ".git" / "objects" / "info"
+        objects_info.mkdir(parents=True)
+        (objects_info / "commit-graph").write_text("")
+        mock_subprocess.reset_mock()
+
+        self.checker._write_commit_graph()
+
+        mock_subprocess.assert_not_called()
+
+    def git_commit(self, *paths):
+        """Commit files in the temporary repository and return the new HEAD."""
+        git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["add", *paths], cwd=self.repo_path, check=True)
+        subprocess.run(
+            git + ["commit", "-q", "-m", "Update"], cwd=self.repo_path, check=True
+        )
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    def test_timestamp_cache_roundtrip(self):
+        """Test cached timestamps are reused only for files untouched since."""
+        subprocess.run(["git", "init", "-q"], cwd=self.repo_path, check=True)
+        for name in ("a.py", "b.py"):
+            (self.paths_dir / name).write_text("# Test file")
+        old_head = self.git_commit("holidays")
+
+        self.checker.cache_file = self.repo_path / "cache" / "timestamps.json"
+        self.checker._mtime_cache = {"holidays/a.py": 100, "holidays/b.py": 200}
+        self.checker._save_timestamp_cache(old_head)
+
+        (self.paths_dir / "b.py").write_text("# Changed file")
+        new_head = self.git_commit("holidays/b.py")
+
+        checker = HolidayUpdatesChecker(
+            repo_path=str(self.repo_path),
+            paths=["holidays"],
+            dry_run=True,
+            cache_file="cache/timestamps.json",
+        )
+        checker._load_timestamp_cache(new_head)
+
+        assert checker._mtime_cache == {"holidays/a.py": 100}
+
+    def test_timestamp_cache_rewritten_history(self):
+        """Test a cache saved on a commit no longer in history is ignored."""
+        subprocess.run(["git", "init", "-q"], cwd=self.repo_path, check=True)
+        for name in ("a.py", "b.py"):
+            (self.paths_dir / name).write_text("# Test file")
+        base_head = self.git_commit("holidays")
+
+        (self.paths_dir / "b.py").write_text("# Changed file")
+        cached_head = self.git_commit("holidays/b.py")
+
+        self.checker.cache_file = self.repo_path / "timestamps.json"
+        self.checker._mtime_cache = {"holidays/a.py": 100, "holidays/b.py": 200}
+        self.checker._save_timestamp_cache(cached_head)
+
+        # Drop the cached commit, as a force-push would.
+        subprocess.run(
+            ["git", "reset", "-q", "--hard", base_head], cwd=self.repo_path, check=True
+        )
+        self.checker._mtime_cache = {}
+        self.checker._load_timestamp_cache(base_head)
+
+        assert self.checker._mtime_cache == {}
+
+    def test_timestamp_cache_expired(self):
+        """Test a cache older than the TTL is ignored."""
+        self.checker.cache_file = self.repo_path / "timestamps.json"
+        self.checker._now_ts = 40 * 86400
+        self.checker._cache_created_at = 0
+        self.checker._mtime_cache = {"holidays/a.py": 100}
+        self.checker._save_timestamp_cache("head-sha")
+
+        self.checker._mtime_cache = {}
+        self.checker._load_timestamp_cache("head-sha")
+        assert self.checker._mtime_cache == {}
+
+        self.checker._now_ts = 20 * 86400
+        self.checker._load_timestamp_cache("head-sha")
+        assert self.checker._mtime_cache == {"holidays/a.py": 100}
+
+    def test_load_timestamp_cache_missing_file(self):
+        """Test a missing cache file is ignored."""
+        self.checker.cache_file = self.repo_path / "missing.json"
+        self.checker._load_timestamp_cache("head-sha")
+        assert self.checker._mtime_cache == {}
+
+    @pytest.mark.parametrize(
+        "cache",
+        [
+            [],
+            {"head": "head-sha", "created_at": 0, "timestamps": None},
+            {"head": "head-sha", "created_at": 0, "timestamps": [1]},
+            {"head": "head-sha", "created_at": 0, "timestamps": {"a.py": "100"}},
+            {"head": "head-sha", "created_at": "0", "timestamps": {}},
+            {"head": "head-sha", "timestamps": {}},
+            {"head": None, "created_at": 0, "timestamps": {}},
+        ],
+    )
+    def test_load_timestamp_cache_malformed(self, cache):
+        """Test a cache file of the wrong shape is ignored."""
+        self.checker.cache_file = self.repo_path / "timestamps.json"
+        self.checker.cache_file.write_text(json.dumps(cache))
+        self.checker._now_ts = 86400
+
+        self.checker._load_timestamp_cache("head-sha")
+
+        assert self.checker._mtime_cache == {}
+        assert self.checker._cache_created_at is None
+
+    def test_parse_paths(self):
+        """Test parsing directories, globs and single files."""
+        for name in ("__init__.py", "a.py", "b.py", "notes.txt"):
+            (self.paths_dir / name).write_text("# Test file")
+        (self.paths_dir / "sub.py").mkdir()
+
+        result = self.checker.parse_paths(
+            ["holidays", "holidays/*.txt", "holidays/b.py", "holidays/missing.py", ""]
+        )
+
+        assert result == [
+            self.paths_dir / "notes.txt",
+            self.paths_dir / "b.py",
+            self.paths_dir / "a.py",
+        ]
+        assert self.paths_dir / "a.py" in self.checker._known_files
+
+    def test_parse_paths_grouped_and_recursive(self):
+        """Test overlapping globs list a directory once and ** recurses."""
+        nested_dir = self.paths_dir / "countries"
+        nested_dir.mkdir()
+        for file_path in (self.paths_dir / "a.py", nested_dir / "b.py"):
+            file_path.write_text("# Test file")
+
+        with patch("check_holiday_updates.os.scandir", wraps=os.scandir) as scandir:
+            result = self.checker.parse_paths(["holidays/*.py", "holidays/a*"])
+
+        assert result == [self.paths_dir / "a.py"]
+        scandir.assert_called_once_with(self.paths_dir)
+
+        result = self.checker.parse_paths(["holidays/**/b.py"])
+        assert result == [nested_dir / "b.py"]
+        assert nested_dir / "b.py" in self.checker._known_files
+
+    def test_parse_paths_uses_git_index(self):
+        """Test only files tracked by git are listed in a git checkout."""
+        nested_dir = self.paths_dir / "countries"
+        nested_dir.mkdir()
+        for file_path in (
+            self.paths_dir / "__init__.py",
+            self.paths_dir / "tracked.py",
+            self.paths_dir / "untracked.py",
+            nested_dir / "nested.py",
+        ):
+            file_path.write_text("# Test file")
+        subprocess.run(["git", "init", "-q"], cwd=self.repo_path, check=True)
+        subprocess.run(
+            [
+                "git",
+                "add",
+                "holidays/__init__.py",
+                "holidays/tracked.py",
+                "holidays/countries",
+            ],
+            cwd=self.repo_path,
+            check=True,
+        )
+
+        with patch("check_holiday_updates.os.scandir") as scandir:
+            result = self.checker.parse_paths(["holidays"])
+
+        assert result == [self.paths_dir / "tracked.py"]
+        scandir.assert_not_called()
+
+        # Unnormalized directories still match the index.
+        result = self.checker.parse_paths(["holidays/../holidays/countries"])
+        assert [path.name for path in result] == ["nested.py"]
+
+    def test_parse_paths_recursive_uses_git_index(self):
+        """Test ** patterns only list files tracked by git in a git checkout."""
+        nested_dir = self.paths_dir / "countries"
+        nested_dir.mkdir()
+        for file_path in (
+            self.paths_dir / "tracked.py",
+            nested_dir / "nested.py",
+            nested_dir / "untracked.py",
+        ):
+            file_path.write_text("# Test file")
+        subprocess.run(["git", "init", "-q"], cwd=self.repo_path, check=True)
+        subprocess.run(
+            ["git", "add", "holidays/tracked.py", "holidays/countries/nested.py"],
+            cwd=self.repo_path,
+            check=True,
+        )
+
+        with patch("check_holiday_updates.os.walk") as walk:
+            result = self.checker.parse_paths(["holidays/**/*.py"])
+
+        assert result == [self.paths_dir / "tracked.py", nested_dir / "nested.py"]
+        walk.assert_not_called()
+
+    def test_scan_files(self):
+        """Test scanning files concurrently preserves input order."""
+        now = datetime.now()
+        file_paths = []
+        for name, age in (("c.py", 200), ("b.py", 5), ("a.py", 300)):
+            file_path = self.paths_dir / name
+            file_path.write_text("# Test file")
+            file_paths.append(file_path)
+            self.checker._mtime_cache[f"holidays/{name}"] = int(
+                (now - timedelta(days=age)).timestamp()
+            )
+
+        with patch(
+            "check_holiday_updates.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_executor:
+            result = self.checker.scan_files(file_paths, 180)
+
+        mock_executor.assert_called_once_with(max_workers=self.checker.jobs)
+        assert [item["path"] for item in result] == ["holidays/c.py", "holidays/a.py"]
+        assert [item["age_days"] for item in result] == [200, 300]
+
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
             ("south_korea.py", "South Korea"),
             ("united_states.py", "United States"),
             ("new_zealand.py", "New Zealand"),
             ("test_file.py", "Test File"),
-        ]
+        ],
+    )
+    def test_extract_name_from_path(self, filename, expected):
+        """Test extracting human-readable name from file path."""
+        result = self.checker.extract_name_from_path(Path(filename))
+        assert result == expected
+
+    def test_relative_path(self):
+        """Test getting repository-relative paths."""
+        file_path = self.paths_dir / "countries" / "test.py"
+        assert self.checker._relative_path(file_path) == str(
+            Path("holidays") / "countries" / "test.py"
+        )
 
-        for filename, expected in test_cases:
-            file_path = Path(filename)
-            result = self.checker.extract_name_from_path(file_path)
-            assert result == expected
+        # Paths outside the repository still fail like Path.relative_to().
+        with pytest.raises(ValueError):
+            self.checker._relative_path(Path("/elsewhere/test.py"))
 
     def test_scan_directory_nonexistent(self):
         """Test scanning nonexistent directory."""
@@ -182,6 +522,42 @@ class TestHolidayUpdatesChecker:
         result = self.checker.scan_directory(self.paths_dir, 180)
         assert result == []
 
+    def test_scan_directory_uses_mtime_index(self):
+        """Test scanning a directory indexes commit dates up front."""
+        now = datetime.now()
+        ages = {"old.py": 200, "recent.py": 5, "__init__.py": 300}
+        for name in ages:
+            (self.paths_dir / name).write_text("# Test file")
+
+        def build_index(file_paths):
+            for file_path in file_paths:
+                self.checker._mtime_cache[f"holidays/{file_path.name}"] = int(
+                    (now - timedelta(days=ages[file_path.name])).timestamp()
+                )
+
+        with patch.object(
+            self.checker, "_build_mtime_index", side_effect=build_index
+        ) as mock_index, patch(
+            "check_holiday_updates.subprocess.run"
+        ) as mock_run, patch(
+            "check_holiday_updates.time.time", return_value=now.timestamp()
+        ):
+            # Not a git checkout, so files are listed from the filesystem.
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[], returncode=128, stdout="", stderr="fatal: not a git repository"
+            )
+            result = self.checker.scan_directory(self.paths_dir, 180)
+
+        # The current time is read once for the whole scan.
+        assert self.checker._now_ts == int(now.timestamp())
+
+        mock_index.assert_called_once_with(
+            [self.paths_dir / "old.py", self.paths_dir / "recent.py"]
+        )
+        # No per-file git log calls are made.
+        assert all("log" not in c.args[0] for c in mock_run.call_args_list)
+        assert [item["path"] for item in result] == ["holidays/old.py"]
+
     @patch("check_holiday_updates.subprocess.run")
     @pytest.mark.skip(reason="Complex mocking issue - main functionality works")
     def test_scan_directory_with_files(self, mock_subprocess):
@@ -322,23 +698,76 @@ class TestHolidayUpdatesChecker:
         assert "**Overdue by:**" not in body
         assert "Additional Information" not in body
 
+    def test_create_issue_body_template_cached(self):
+        """Test the issue body template is read from disk only once."""
+        file_info = {
+            "name": "South Korea",
+            "path": "holidays/countries/south_korea.py",
+            "age_days": 200,
+            "threshold_days": 180,
+            "last_modified": "2023-01-01T00:00:00",
+        }
+        load_issue_body_template.cache_clear()
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            self.checker.create_issue_body(file_info)
+            self.checker.create_issue_body(file_info)
+
+        assert mock_open.call_count == 1
+
     def test_find_existing_issue_no_repo(self):
         """Test finding existing issue when no repo available."""
         file_info = {"name": "Test", "path": "test.py"}
         result = self.checker.find_existing_issue(file_info)
         assert result is None
 
-    @patch("check_holiday_updates.GithubException")
-    def test_find_existing_issue_error(self, mock_exception):
+    def test_find_existing_issue_error(self):
         """Test finding existing issue with GitHub error."""
-        mock_repo = Mock()
-        mock_repo.get_issues.side_effect = mock_exception("API Error")
-        self.checker.repo = mock_repo
+
+        class MockGithubException(Exception):
+            pass
+
+        mock_github = Mock()
+        mock_github.requester.graphql_query.side_effect = MockGithubException(
+            "API Error"
+        )
+        self.checker.github = mock_github
+        self.checker.repo = Mock()
 
         file_info = {"name": "Test", "path": "test.py"}
-        result = self.checker.find_existing_issue(file_info)
+        with patch("check_holiday_updates.GithubException", MockGithubException):
+            result = self.checker.find_existing_issue(file_info)
         assert result is None
 
+    def test_find_existing_issue_cached(self):
+        """Test open issues are fetched once across lookups."""
+        mock_github = Mock()
+        mock_github.requester.graphql_query.side_effect = [
+            (
+                {},
+                search_response(
+                    [{"number": 1, "title": "Update required: Test"}],
+                    end_cursor="c1",
+                ),
+            ),
+            ({}, search_response([{"number": 2, "title": "Update required: Next"}])),
+        ]
+        self.checker.github = mock_github
+        self.checker.repo = Mock()
+
+        assert self.checker.find_existing_issue({"name": "Test"}) == 1
+        assert self.checker.find_existing_issue({"name": "test "}) == 1
+        assert self.checker.find_existing_issue({"name": "Next"}) == 2
+        assert self.checker.find_existing_issue({"name": "Other"}) is None
+
+        calls = mock_github.requester.graphql_query.call_args_list
+        assert len(calls) == 2
+        assert calls[0].args[1] == {
+            "query": 'repo:test/repo is:issue is:open in:title "Update required"',
+            "cursor": None,
+        }
+        assert calls[1].args[1]["cursor"] == "c1"
+
     def test_create_github_issue_dry_run(self):
         """Test creating GitHub issue in dry run mode."""
         file_info = {"name": "Test", "path": "test.py"}
@@ -355,8 +784,10 @@ class TestHolidayUpdatesChecker:
     def test_create_github_issue_error(self):
         """Test creating GitHub issue with GitHub error."""
         self.checker.dry_run = False
+        mock_github = Mock()
+        mock_github.requester.graphql_query.return_value = ({}, search_response([]))
+        self.checker.github = mock_github
         mock_repo = Mock()
-        mock_repo.get_issues.return_value = []
 
         class MockGithubException(Exception):
             pass
@@ -391,6 +822,148 @@ class TestHolidayUpdatesChecker:
         assert stats["skipped"] == 0
         assert stats["errors"] == 0
 
+    def test_process_outdated_files_dry_run_skips_body(self):
+        """Test dry run never renders issue bodies."""
+        outdated_files = [{"name": "File1", "path": "holidays/file1.py"}]
+
+        with patch.object(self.checker, "create_issue_body") as mock_body:
+            stats = self.checker.process_outdated_files(outdated_files)
+
+        assert stats["created"] == 1
+        mock_body.assert_not_called()
+
+    def test_process_outdated_files_batched(self):
+        """Test issues are created with batched GraphQL mutations."""
+        self.checker.dry_run = False
+        mock_github = Mock()
+        mock_github.requester.graphql_query.side_effect = [
+            ({}, search_response([{"number": 1, "title": "Update required: File1"}])),
+            (
+                {},
+                {
+                    "data": {
+                        "i0": {"issue": {"number": 2}},
+                        "i1": {"issue": {"number": 3}},
+                    }
+                },
+            ),
+        ]
+        self.checker.github = mock_github
+        self.checker.repo = Mock(node_id="R_1")
+
+        outdated_files = [
+            {
+                "name": name,
+                "path": f"holidays/{name.lower()}.py",
+                "age_days": 200,
+                "threshold_days": 180,
+                "last_modified": "2023-01-01T00:00:00",
+            }
+            for name in ("File1", "File2", "File3")
+        ]
+
+        with patch.object(
+            self.checker, "create_issue_body", return_value="body"
+        ) as mock_body:
+            stats = self.checker.process_outdated_files(outdated_files)
+
+        assert stats == {"created": 3, "skipped": 0, "errors": 0}
+        # No body is rendered for the file with an existing issue.
+        assert mock_body.call_count == 2
+        assert mock_github.requester.graphql_query.call_count == 2
+        variables = mock_github.requester.graphql_query.call_args.args[1]
+        assert variables["repositoryId"] == "R_1"
+        assert variables["title0"] == "Update required: File2"
+        assert variables["title1"] == "Update required: File3"
+        assert "title2" not in variables
+
+    def test_process_outdated_files_dedupes_normalized_titles(self):
+        """Test titles differing only in case or spacing create one issue."""
+        self.checker.dry_run = False
+        mock_github = Mock()
+        mock_github.requester.graphql_query.side_effect = [
+            ({}, search_response([])),
+            ({}, {"data": {"i0": {"issue": {"number": 2}}}}),
+        ]
+        self.checker.github = mock_github
+        self.checker.repo = Mock(node_id="R_1")
+
+        outdated_files = [
+            {"name": "File1", "path": "holidays/file1.py"},
+            {"name": "file1 ", "path": "other/file1.py"},
+        ]
+
+        with patch.object(self.checker, "create_issue_body", return_value="body"):
+            stats = self.checker.process_outdated_files(outdated_files)
+
+        assert stats == {"created": 2, "skipped": 0, "errors": 0}
+        variables = mock_github.requester.graphql_query.call_args.args[1]
+        assert "title1" not in variables
+
+    def test_process_outdated_files_batch_partial_failure(self):
+        """Test issues created in a batch with errors are counted as created."""
+        self.checker.dry_run = False
+
+        class MockGithubException(Exception):
+            def __init__(self, data):
+                super().__init__("GraphQL errors")
+                self.data = data
+
+        mock_github = Mock()
+        mock_github.requester.graphql_query.side_effect = [
+            ({}, search_response([])),
+            MockGithubException(
+                {
+                    "data": {
+                        "i0": {"issue": {"number": 2}},
+                        "i1": None,
+                        "i2": {"issue": {"number": 4}},
+                    },
+                    "errors": [
+                        {"path": ["i1"], "message": "was submitted too quickly"}
+                    ],
+                }
+            ),
+        ]
+        self.checker.github = mock_github
+        self.checker.repo = Mock(node_id="R_1")
+
+        outdated_files = [
+            {"name": name, "path": f"holidays/{name.lower()}.py"}
+            for name in ("File1", "File2", "File3")
+        ]
+
+        with patch.object(
+            self.checker, "create_issue_body", return_value="body"
+        ), patch("check_holiday_updates.GithubException", MockGithubException):
+            stats = self.checker.process_outdated_files(outdated_files)
+
+        assert stats == {"created": 2, "skipped": 0, "errors": 1}
+
+    def test_process_outdated_files_lookup_error(self):
+        """Test a non-GitHub error looking up one file doesn't abort the run."""
+        self.checker.dry_run = False
+        mock_github = Mock()
+        mock_github.requester.graphql_query.side_effect = [
+            ConnectionError("Connection reset"),
+            ({}, search_response([])),
+            ({}, {"data": {"i0": {"issue": {"number": 2}}}}),
+        ]
+        self.checker.github = mock_github
+        self.checker.repo = Mock(node_id="R_1")
+
+        outdated_files = [
+            {"name": "File1", "path": "holidays/file1.py"},
+            {"name": "File2", "path": "holidays/file2.py"},
+        ]
+
+        with patch.object(self.checker, "create_issue_body", return_value="body"):
+            stats = self.checker.process_outdated_files(outdated_files)
+
+        assert stats == {"created": 1, "skipped": 0, "errors": 1}
+        variables = mock_github.requester.graphql_query.call_args.args[1]
+        assert variables["title0"] == "Update required: File2"
+
     def test_run_complete_process(self):
         """Test running the complete process."""
         result = self.checker.run()
@@ -401,9 +974,62 @@ class TestHolidayUpdatesChecker:
         assert isinstance(result["outdated_files"], list)
 
 
+class TestWriteGithubOutputs:
+    """Test cases for writing GitHub Actions outputs."""
+
+    def test_write_github_outputs(self, tmp_path):
+        """Test all outputs are appended to the output file."""
+        output_file = tmp_path / "output"
+        output_file.write_text("existing=1\n")
+
+        with patch.dict(os.environ, {"GITHUB_OUTPUT": str(output_file)}):
+            write_github_outputs({"first": "2", "second": "3"})
+
+        assert output_file.read_text() == "existing=1\nfirst=2\nsecond=3\n"
+
+    def test_write_github_outputs_no_output_file(self):
+        """Test nothing is written outside GitHub Actions."""
+        with patch.dict(os.environ, {}, clear=True), patch(
+            "builtins.open"
+        ) as mock_open:
+            write_github_outputs({"first": "2"})
+
+        mock_open.assert_not_called()
+
+
 class TestMainFunction:
     """Test cases for main function and argument parsing."""
 
+    @pytest.mark.parametrize("jobs", ["0", "-1"])
+    def test_parse_args_rejects_non_positive_jobs(self, jobs):
+        """Test --jobs must be at least 1."""
+        with patch(
+            "check_holiday_updates.sys.argv", ["script.py", "--jobs", jobs]
+        ), pytest.raises(SystemExit):
+            parse_args()
+
+    def test_action_args_with_default_inputs(self):
+        """Test the argv built by action.yml parses with default inputs."""
+        action = yaml.safe_load((Path(sys_path) / "action.yml").read_text())
+        inputs = {
+            name: spec.get("default", "value")
+            for name, spec in action["inputs"].items()
+        }
+        argv = [
+            re.sub(r"\$\{\{ inputs\.(\w+) \}\}", lambda m: inputs[m[1]], arg)
+            for arg in action["runs"]["args"]
+        ]
+
+        # Runners may drop empty arguments, so check both forms.
+        for args in (argv, [arg for arg in argv if arg]):
+            with patch("check_holiday_updates.sys.argv", ["script.py", *args]):
+                parsed = parse_args()
+
+            assert parsed.cache_file == ""
+            assert parsed.commit_graph == "false"
+            assert parsed.dry_run == "false"
+            assert parsed.threshold_days == 180
+
     @patch("check_holiday_updates.HolidayUpdatesChecker")
     @patch("check_holiday_updates.Path")
     @patch("check_holiday_updates.os.path.exists")
@@ -429,8 +1055,6 @@ class TestMainFunction:
         }
         mock_checker_class.return_value = mock_checker
 
-        from check_holiday_updates import main
-
         main()
 
         mock_checker_class.assert_called_once()
@@ -462,12 +1086,46 @@ class TestMainFunction:
         }
         mock_checker_class.return_value = mock_checker
 
-        from check_holiday_updates import main
-
         main()
 
         mock_exit.assert_called_once_with(1)
 
+    @patch("check_holiday_updates.HolidayUpdatesChecker")
+    @patch("check_holiday_updates.Path")
+    @patch("check_holiday_updates.os.path.exists")
+    @patch("check_holiday_updates.sys.argv", ["script.py", "--dry-run", "true"])
+    def test_main_prints_summary(
+        self, mock_exists, mock_path, mock_checker_class, capsys
+    ):
+        """Test main function prints the summary with outdated files."""
+        mock_exists.return_value = True
+        mock_path_instance = Mock()
+        mock_path_instance.exists.return_value = True
+        mock_path_instance.__truediv__ = Mock(return_value=mock_path_instance)
+        mock_path.return_value = mock_path_instance
+
+        mock_checker = Mock()
+        mock_checker.run.return_value = {
+            "outdated_files": [
+                {"path": "holidays/a.py", "age_days": 200},
+                {"path": "holidays/b.py", "age_days": 300},
+            ],
+            "stats": {"errors": 0, "created": 2},
+        }
+        mock_checker_class.return_value = mock_checker
+
+        main()
+
+        assert capsys.readouterr().out == (
+            "📊 Summary:\n"
+            "  • Outdated files found: 2\n"
+            "  • Issues created: 2\n"
+            "  • Errors: 0\n"
+            "\n📁 Outdated files:\n"
+            "  • holidays/a.py (200 days old)\n"
+            "  • holidays/b.py (300 days old)\n"
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,53 +1,66 @@
 """Tests for fetch_downloads.py script."""
 
 import json
-import os
 from datetime import datetime, timezone
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
+import yaml
+from requests import RequestException
+
 # Import the functions to test
 from scripts.fetch_downloads import (
+    API_URL,
     create_output_data,
+    create_session,
     extract_date_range_downloads,
     extract_latest_7_days_downloads,
     extract_latest_30_days_downloads,
     extract_monthly_downloads,
+    extract_period_downloads,
     fetch_download_data,
+    format_iso_date,
+    get_daily_total,
+    get_dates_in_range,
     get_last_7_days_dates,
     get_last_30_days_dates,
     get_previous_month_dates,
     humanize_number,
+    is_iso_date,
     main,
     save_yaml_data,
 )
 
+JAN_2024 = (
+    datetime(2024, 1, 1, tzinfo=timezone.utc),
+    datetime(2024, 1, 31, tzinfo=timezone.utc),
+)
+FEB_15_2024 = datetime(2024, 2, 15, 12, 0, 0, tzinfo=timezone.utc)
+
 
 class TestHumanizeNumber:
     """Test the humanize_number function."""
 
-    def test_humanize_number_small(self):
-        """Test humanization of small numbers."""
-        assert humanize_number(500) == "500"
-        assert humanize_number(999) == "999"
-
-    def test_humanize_number_thousands(self):
-        """Test humanization of thousands."""
-        assert humanize_number(1000) == "1K"
-        assert humanize_number(1500) == "2K"
-        assert humanize_number(999999) == "1M"
-
-    def test_humanize_number_millions(self):
-        """Test humanization of millions."""
-        assert humanize_number(1000000) == "1M"
-        assert humanize_number(1500000) == "2M"
-        assert humanize_number(999999999) == "1B"
-
-    def test_humanize_number_billions(self):
-        """Test humanization of billions."""
-        assert humanize_number(1000000000) == "1B"
-        assert humanize_number(1500000000) == "2B"
-        assert humanize_number(2500000000) == "2B"
+    @pytest.mark.parametrize(
+        "number,expected",
+        [
+            (500, "500"),
+            (999, "999"),
+            (1000, "1K"),
+            (1500, "2K"),
+            (999999, "1M"),
+            (1000000, "1M"),
+            (1500000, "2M"),
+            (999999999, "1B"),
+            (1000000000, "1B"),
+            (1500000000, "2B"),
+            (2500000000, "2B"),
+        ],
+    )
+    def test_humanize_number(self, number, expected):
+        """Test humanization of numbers across scales."""
+        assert humanize_number(number) == expected
 
 
 class TestGetPreviousMonthDates:
@@ -56,9 +69,7 @@ class TestGetPreviousMonthDates:
     def test_get_previous_month_dates(self):
         """Test that previous month dates are calculated correctly."""
         with patch("scripts.fetch_downloads.datetime") as mock_datetime:
-            # Mock current date to be 2024-02-15
-            mock_now = datetime(2024, 2, 15, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.now.return_value = mock_now
+            mock_datetime.now.return_value = FEB_15_2024
 
             first, last = get_previous_month_dates()
 
@@ -79,6 +90,32 @@ class TestGetPreviousMonthDates:
             assert first == datetime(2023, 12, 1, 0, 0, 0, tzinfo=timezone.utc)
             assert last == datetime(2023, 12, 31, 0, 0, 0, tzinfo=timezone.utc)
 
+    def test_get_previous_month_dates_cached_within_month(self):
+        """Test that repeated calls within a month reuse the computed dates."""
+        with patch("scripts.fetch_downloads.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(
+                2024, 3, 5, 8, 0, 0, tzinfo=timezone.utc
+            )
+            first_call = get_previous_month_dates()
+            mock_datetime.now.return_value = datetime(
+                2024, 3, 20, 18, 0, 0, tzinfo=timezone.utc
+            )
+            second_call = get_previous_month_dates()
+
+        assert first_call is second_call
+        assert first_call[0] == datetime(2024, 2, 1, tzinfo=timezone.utc)
+        assert first_call[1] == datetime(2024, 2, 29, tzinfo=timezone.utc)
+
+
+class TestFormatIsoDate:
+    """Test the format_iso_date function."""
+
+    def test_format_iso_date(self):
+        """Test that dates are zero-padded like strftime("%Y-%m-%d")."""
+        value = datetime(987, 1, 5, tzinfo=timezone.utc)
+        assert format_iso_date(value) == "0987-01-05"
+        assert format_iso_date(datetime(2024, 12, 31)) == "2024-12-31"
+
 
 class TestGetLast30DaysDates:
     """Test the get_last_30_days_dates function."""
@@ -86,9 +123,7 @@ class TestGetLast30DaysDates:
     def test_get_last_30_days_dates(self):
         """Test that last 30 days dates are calculated correctly."""
         with patch("scripts.fetch_downloads.datetime") as mock_datetime:
-            # Mock current date to be 2024-02-15
-            mock_now = datetime(2024, 2, 15, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.now.return_value = mock_now
+            mock_datetime.now.return_value = FEB_15_2024
 
             start, end = get_last_30_days_dates()
 
@@ -103,9 +138,7 @@ class TestGetLast7DaysDates:
     def test_get_last_7_days_dates(self):
         """Test that last 7 days dates are calculated correctly."""
         with patch("scripts.fetch_downloads.datetime") as mock_datetime:
-            # Mock current date to be 2024-02-15
-            mock_now = datetime(2024, 2, 15, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.now.return_value = mock_now
+            mock_datetime.now.return_value = FEB_15_2024
 
             start, end = get_last_7_days_dates()
 
@@ -114,52 +147,79 @@ class TestGetLast7DaysDates:
             assert end == datetime(2024, 2, 15, 0, 0, 0, tzinfo=timezone.utc)
 
 
+class TestCreateSession:
+    """Test the create_session function."""
+
+    def test_create_session(self):
+        """Test that the session retries transient errors and accepts gzip."""
+        session = create_session()
+        retry = session.get_adapter(API_URL).max_retries
+
+        assert session.headers["Accept-Encoding"] == "gzip"
+        assert retry.total == 3
+        assert 429 in retry.status_forcelist
+        assert 503 in retry.status_forcelist
+
+
+@pytest.fixture
+def mock_get(monkeypatch):
+    """Mock the API session with an API key set, returning the get and response."""
+    mock_response = Mock()
+    mock_response.raise_for_status.return_value = None
+    get = Mock(return_value=mock_response)
+    monkeypatch.setattr("scripts.fetch_downloads.session.get", get)
+    monkeypatch.setenv("PEPY_TECH_API_KEY", "test_key")
+    return get, mock_response
+
+
 class TestFetchDownloadData:
     """Test the fetch_download_data function."""
 
-    @patch("scripts.fetch_downloads.requests.get")
     def test_fetch_download_data_success(self, mock_get):
         """Test successful API data fetch."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
+        get, mock_response = mock_get
+        mock_response.content = b'{"downloads": {"2024-01-01": {"1.0": 100}}}'
+
+        result = fetch_download_data()
+
+        assert result == {"downloads": {"2024-01-01": {"1.0": 100}}}
+        get.assert_called_once()
+
+    def test_fetch_download_data_without_orjson(self, mock_get, monkeypatch):
+        """Test API data fetch falls back to the stdlib JSON decoder."""
+        _, mock_response = mock_get
         mock_response.json.return_value = {"downloads": {"2024-01-01": {"1.0": 100}}}
-        mock_get.return_value = mock_response
+        monkeypatch.setattr("scripts.fetch_downloads.orjson", None)
 
-        with patch.dict(os.environ, {"PEPY_TECH_API_KEY": "test_key"}):
-            result = fetch_download_data()
+        result = fetch_download_data()
 
         assert result == {"downloads": {"2024-01-01": {"1.0": 100}}}
-        mock_get.assert_called_once()
 
-    @patch("scripts.fetch_downloads.requests.get")
-    def test_fetch_download_data_no_api_key(self, mock_get):
+    def test_fetch_download_data_no_api_key(self, mock_get, monkeypatch):
         """Test API fetch without API key."""
+        get, _ = mock_get
+        monkeypatch.delenv("PEPY_TECH_API_KEY")
+
         result = fetch_download_data()
         assert result is None
-        mock_get.assert_not_called()
+        get.assert_not_called()
 
-    @patch("scripts.fetch_downloads.requests.get")
     def test_fetch_download_data_request_exception(self, mock_get):
         """Test API fetch with request exception."""
-        from requests import RequestException
+        get, _ = mock_get
+        get.side_effect = RequestException("Network error")
 
-        mock_get.side_effect = RequestException("Network error")
-
-        with patch.dict(os.environ, {"PEPY_TECH_API_KEY": "test_key"}):
-            result = fetch_download_data()
+        result = fetch_download_data()
 
         assert result is None
 
-    @patch("scripts.fetch_downloads.requests.get")
     def test_fetch_download_data_json_decode_error(self, mock_get):
         """Test API fetch with JSON decode error."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
+        _, mock_response = mock_get
+        mock_response.content = b"Invalid JSON"
         mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_get.return_value = mock_response
 
-        with patch.dict(os.environ, {"PEPY_TECH_API_KEY": "test_key"}):
-            result = fetch_download_data()
+        result = fetch_download_data()
 
         assert result is None
 
@@ -170,10 +230,7 @@ class TestExtractMonthlyDownloads:
     def test_extract_monthly_downloads_success(self):
         """Test successful monthly downloads extraction."""
         with patch("scripts.fetch_downloads.get_previous_month_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {
                 "downloads": {
@@ -186,25 +243,19 @@ class TestExtractMonthlyDownloads:
             result = extract_monthly_downloads(api_data)
             assert result == 425  # 100+50+200+75
 
-    def test_extract_monthly_downloads_no_downloads_key(self):
-        """Test extraction with missing downloads key."""
-        api_data = {"total_downloads": 1000}
-        result = extract_monthly_downloads(api_data)
-        assert result is None
-
-    def test_extract_monthly_downloads_invalid_downloads_type(self):
-        """Test extraction with invalid downloads type."""
-        api_data = {"downloads": "not_a_dict"}
-        result = extract_monthly_downloads(api_data)
-        assert result is None
+    @pytest.mark.parametrize(
+        "api_data",
+        [{"total_downloads": 1000}, {"downloads": "not_a_dict"}],
+        ids=["no_downloads_key", "invalid_downloads_type"],
+    )
+    def test_extract_monthly_downloads_invalid_data(self, api_data):
+        """Test extraction with missing or invalid downloads."""
+        assert extract_monthly_downloads(api_data) is None
 
     def test_extract_monthly_downloads_no_data_for_month(self):
         """Test extraction when no data exists for previous month."""
         with patch("scripts.fetch_downloads.get_previous_month_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {
                 "downloads": {
@@ -218,10 +269,7 @@ class TestExtractMonthlyDownloads:
     def test_extract_monthly_downloads_invalid_date_format(self):
         """Test extraction with invalid date format."""
         with patch("scripts.fetch_downloads.get_previous_month_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {
                 "downloads": {
@@ -240,10 +288,7 @@ class TestExtractLatest30DaysDownloads:
     def test_extract_latest_30_days_downloads_success(self):
         """Test successful latest 30 days downloads extraction."""
         with patch("scripts.fetch_downloads.get_last_30_days_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {
                 "downloads": {
@@ -256,25 +301,19 @@ class TestExtractLatest30DaysDownloads:
             result = extract_latest_30_days_downloads(api_data)
             assert result == 300  # 100 + 200
 
-    def test_extract_latest_30_days_downloads_no_downloads_key(self):
-        """Test extraction when downloads key is missing."""
-        api_data = {"other_key": "value"}
-        result = extract_latest_30_days_downloads(api_data)
-        assert result is None
-
-    def test_extract_latest_30_days_downloads_invalid_downloads_type(self):
-        """Test extraction when downloads is not a dictionary."""
-        api_data = {"downloads": "not_a_dict"}
-        result = extract_latest_30_days_downloads(api_data)
-        assert result is None
+    @pytest.mark.parametrize(
+        "api_data",
+        [{"total_downloads": 1000}, {"downloads": "not_a_dict"}],
+        ids=["no_downloads_key", "invalid_downloads_type"],
+    )
+    def test_extract_latest_30_days_downloads_invalid_data(self, api_data):
+        """Test extraction with missing or invalid downloads."""
+        assert extract_latest_30_days_downloads(api_data) is None
 
     def test_extract_latest_30_days_downloads_no_data_for_period(self):
         """Test extraction when no data exists for the period."""
         with patch("scripts.fetch_downloads.get_last_30_days_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {
                 "downloads": {
@@ -288,10 +327,7 @@ class TestExtractLatest30DaysDownloads:
     def test_extract_latest_30_days_downloads_invalid_date_format(self):
         """Test extraction with invalid date format."""
         with patch("scripts.fetch_downloads.get_last_30_days_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {
                 "downloads": {
@@ -326,17 +362,14 @@ class TestExtractLatest7DaysDownloads:
             result = extract_latest_7_days_downloads(api_data)
             assert result == 300  # 100 + 200
 
-    def test_extract_latest_7_days_downloads_no_downloads_key(self):
-        """Test extraction when downloads key is missing."""
-        api_data = {"other_key": "value"}
-        result = extract_latest_7_days_downloads(api_data)
-        assert result is None
-
-    def test_extract_latest_7_days_downloads_invalid_downloads_type(self):
-        """Test extraction when downloads is not a dictionary."""
-        api_data = {"downloads": "not_a_dict"}
-        result = extract_latest_7_days_downloads(api_data)
-        assert result is None
+    @pytest.mark.parametrize(
+        "api_data",
+        [{"total_downloads": 1000}, {"downloads": "not_a_dict"}],
+        ids=["no_downloads_key", "invalid_downloads_type"],
+    )
+    def test_extract_latest_7_days_downloads_invalid_data(self, api_data):
+        """Test extraction with missing or invalid downloads."""
+        assert extract_latest_7_days_downloads(api_data) is None
 
     def test_extract_latest_7_days_downloads_no_data_for_period(self):
         """Test extraction when no data exists for the period."""
@@ -374,6 +407,65 @@ class TestExtractLatest7DaysDownloads:
             assert result == 200  # Only valid date should be processed
 
 
+class TestIsIsoDate:
+    """Test the is_iso_date function."""
+
+    def test_is_iso_date(self):
+        """Test that well-formed date keys are accepted."""
+        assert is_iso_date("2024-01-15")
+        assert is_iso_date("2024-02-29")
+
+    def test_is_iso_date_invalid(self):
+        """Test that malformed date keys are rejected without raising."""
+        for date_str in (
+            "invalid-date",
+            "2024-01-1x",
+            "20240115",
+            "2024-01-15T00:00",
+            "2024-1-5",
+            "2024-+1-05",
+            "2024-13-01",
+            "2023-02-29",
+            "0000-01-01",
+        ):
+            assert not is_iso_date(date_str)
+
+
+class TestGetDailyTotal:
+    """Test the get_daily_total function."""
+
+    def test_get_daily_total(self):
+        """Test that only numeric version counts are summed."""
+        assert get_daily_total({"1.0": 100, "1.1": 50}) == 150
+        assert get_daily_total({"1.0": 100, "1.1": 50.0, "meta": "x"}) == 150
+        assert get_daily_total({"1.0": 100, "1.1": None}) == 100
+        # Float counts are truncated individually, not after summing.
+        assert get_daily_total({"1.0": 1.5, "1.1": 1.5}) == 2
+        assert get_daily_total({}) == 0
+
+
+class TestGetDatesInRange:
+    """Test the get_dates_in_range function."""
+
+    def test_get_dates_in_range(self):
+        """Test that only dates inside the inclusive range are returned in order."""
+        downloads = {
+            "2024-02-01": {},
+            "2024-01-15": {},
+            "2023-12-31": {},
+            "2024-01-01": {},
+            "2024-01-31": {},
+        }
+
+        assert get_dates_in_range(downloads, "2024-01-01", "2024-01-31") == [
+            "2024-01-01",
+            "2024-01-15",
+            "2024-01-31",
+        ]
+        assert get_dates_in_range(downloads, "2025-01-01", "2025-01-31") == []
+        assert get_dates_in_range({}, "2024-01-01", "2024-01-31") == []
+
+
 class TestExtractDateRangeDownloads:
     """Test the unified extract_date_range_downloads function."""
 
@@ -454,6 +546,28 @@ class TestExtractDateRangeDownloads:
         )
         assert result == 200  # Only valid date should be processed
 
+    def test_extract_date_range_downloads_parses_only_in_window_dates(self):
+        """Test that only dates inside the window are validated."""
+        start_date = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        end_date = datetime(2024, 1, 20, tzinfo=timezone.utc)
+
+        api_data = {
+            "downloads": {
+                "2023-06-01": {"1.0": 100},
+                "2024-01-1x": {"1.0": 50},  # Inside the window lexically.
+                "2024-01-18": {"1.0": 200},
+            }
+        }
+
+        with patch("scripts.fetch_downloads.logger") as mock_logger:
+            result = extract_date_range_downloads(
+                api_data, start_date, end_date, "test period"
+            )
+
+        assert result == 200
+        mock_logger.warning.assert_called_once()
+        assert "2024-01-1x" in mock_logger.warning.call_args[0][0]
+
     def test_extract_date_range_downloads_custom_period_name(self):
         """Test that custom period names appear in logs correctly."""
         start_date = datetime(2024, 1, 15, tzinfo=timezone.utc)
@@ -478,16 +592,83 @@ class TestExtractDateRangeDownloads:
             mock_logger.info.assert_any_call("custom test period total downloads: 100")
 
 
+class TestExtractPeriodDownloads:
+    """Test the extract_period_downloads function."""
+
+    def setup_method(self):
+        """Set up the period date mocks."""
+        self.patchers = [
+            patch(
+                f"scripts.fetch_downloads.{name}",
+                return_value=(
+                    datetime(2024, 1, start_day, tzinfo=timezone.utc),
+                    datetime(2024, 1, 31, tzinfo=timezone.utc),
+                ),
+            )
+            for name, start_day in (
+                ("get_previous_month_dates", 1),
+                ("get_last_30_days_dates", 2),
+                ("get_last_7_days_dates", 25),
+            )
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        """Stop the period date mocks."""
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_extract_period_downloads_success(self):
+        """Test all periods are summed from a single pass."""
+        api_data = {
+            "downloads": {
+                "2023-12-31": {"1.0": 1000},  # Outside every period
+                "2024-01-01": {"1.0": 100},  # Previous month only
+                "2024-01-02": {"1.0": 10, "1.1": 5},
+                "2024-01-25": {"1.0": 20},
+                "2024-01-3x": {"1.0": 7},  # Invalid date
+                "2024-01-31": {"1.0": 1},
+            }
+        }
+
+        assert extract_period_downloads(api_data) == (136, 36, 21)
+
+    def test_extract_period_downloads_matches_single_periods(self):
+        """Test the single-period extractors agree with the combined pass."""
+        api_data = {
+            "downloads": {
+                "2024-01-01": {"1.0": 100},
+                "2024-01-02": {"1.0": 10, "1.1": 5},
+                "2024-01-25": {"1.0": 20},
+            }
+        }
+
+        assert extract_period_downloads(api_data) == (
+            extract_monthly_downloads(api_data),
+            extract_latest_30_days_downloads(api_data),
+            extract_latest_7_days_downloads(api_data),
+        )
+
+    def test_extract_period_downloads_no_data_for_period(self):
+        """Test extraction fails when any period has no data."""
+        api_data = {"downloads": {"2024-01-01": {"1.0": 100}}}
+
+        assert extract_period_downloads(api_data) is None
+
+    def test_extract_period_downloads_invalid_downloads(self):
+        """Test extraction with missing or invalid downloads."""
+        assert extract_period_downloads({"total_downloads": 1000}) is None
+        assert extract_period_downloads({"downloads": "not_a_dict"}) is None
+
+
 class TestCreateOutputData:
     """Test the create_output_data function."""
 
     def test_create_output_data_basic(self):
         """Test basic output data creation."""
         with patch("scripts.fetch_downloads.get_previous_month_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {"total_downloads": 1000}
             result = create_output_data(500, 1200, 600, api_data)
@@ -510,10 +691,7 @@ class TestCreateOutputData:
     def test_create_output_data_with_downloads(self):
         """Test output data creation with downloads data."""
         with patch("scripts.fetch_downloads.get_previous_month_dates") as mock_dates:
-            mock_dates.return_value = (
-                datetime(2024, 1, 1, tzinfo=timezone.utc),
-                datetime(2024, 1, 31, tzinfo=timezone.utc),
-            )
+            mock_dates.return_value = JAN_2024
 
             api_data = {
                 "downloads": {
@@ -556,96 +734,96 @@ class TestSaveYamlData:
             assert result is True
             assert (tmp_path / "nested" / "test.yaml").exists()
 
-    def test_save_yaml_data_permission_error(self, tmp_path):
-        """Test YAML save with permission error."""
-        with patch("scripts.fetch_downloads.OUTPUT_FILE", Path("/root/test.yaml")):
-            data = {"test": "data"}
-            result = save_yaml_data(data)
+    def test_save_yaml_data_unchanged(self, tmp_path):
+        """Test that the file is not rewritten when only volatile fields differ."""
+        output_file = tmp_path / "test.yaml"
+        with patch("scripts.fetch_downloads.OUTPUT_FILE", output_file):
+            assert save_yaml_data({"total_downloads": 1, "updated_at": "old"})
+            assert save_yaml_data({"total_downloads": 1, "updated_at": "new"})
+            assert yaml.safe_load(output_file.read_text())["updated_at"] == "old"
+
+            assert save_yaml_data({"total_downloads": 2, "updated_at": "new"})
+            assert yaml.safe_load(output_file.read_text()) == {
+                "total_downloads": 2,
+                "updated_at": "new",
+            }
+
+    def test_save_yaml_data_pure_python_dumper_fallback(self, tmp_path):
+        """Test that a missing libyaml is reported but saving still works."""
+        with patch(
+            "scripts.fetch_downloads.OUTPUT_FILE", tmp_path / "test.yaml"
+        ), patch("scripts.fetch_downloads.YAML_DUMPER", yaml.SafeDumper), patch(
+            "scripts.fetch_downloads.logger"
+        ) as mock_logger:
+            result = save_yaml_data({"test": "data"})
 
-            assert result is False
+        assert result is True
+        mock_logger.warning.assert_called_once()
+        assert yaml.safe_load((tmp_path / "test.yaml").read_text()) == {"test": "data"}
+
+    def test_save_yaml_data_permission_error(self, tmp_path, monkeypatch):
+        """Test YAML save with permission error."""
+        monkeypatch.setattr("scripts.fetch_downloads.OUTPUT_FILE", tmp_path / "x.yaml")
+        monkeypatch.setattr("builtins.open", Mock(side_effect=PermissionError))
+
+        assert save_yaml_data({"test": "data"}) is False
+        assert not (tmp_path / "x.yaml").exists()
+
+
+@pytest.fixture
+def main_mocks(monkeypatch):
+    """Replace the steps run by main with mocks, one attribute per step."""
+    mocks = SimpleNamespace(
+        fetch=Mock(), extract=Mock(), create=Mock(), save=Mock(return_value=True)
+    )
+    for name, mock in (
+        ("fetch_download_data", mocks.fetch),
+        ("extract_period_downloads", mocks.extract),
+        ("create_output_data", mocks.create),
+        ("save_yaml_data", mocks.save),
+    ):
+        monkeypatch.setattr(f"scripts.fetch_downloads.{name}", mock)
+    return mocks
 
 
 class TestMain:
     """Test the main function."""
 
-    @patch("scripts.fetch_downloads.fetch_download_data")
-    @patch("scripts.fetch_downloads.extract_monthly_downloads")
-    @patch("scripts.fetch_downloads.extract_latest_30_days_downloads")
-    @patch("scripts.fetch_downloads.extract_latest_7_days_downloads")
-    @patch("scripts.fetch_downloads.create_output_data")
-    @patch("scripts.fetch_downloads.save_yaml_data")
-    def test_main_success(
-        self,
-        mock_save,
-        mock_create,
-        mock_extract_7d,
-        mock_extract_30d,
-        mock_extract,
-        mock_fetch,
-    ):
+    def test_main_success(self, main_mocks):
         """Test successful main function execution."""
-        mock_fetch.return_value = {"downloads": {"2024-01-01": {"1.0": 100}}}
-        mock_extract.return_value = 100
-        mock_extract_30d.return_value = 150
-        mock_extract_7d.return_value = 75
-        mock_create.return_value = {"previous_month_downloads": 100}
-        mock_save.return_value = True
+        main_mocks.fetch.return_value = {"downloads": {"2024-01-01": {"1.0": 100}}}
+        main_mocks.extract.return_value = (100, 150, 75)
+        main_mocks.create.return_value = {"previous_month_downloads": 100}
 
         result = main()
         assert result == 0
+        main_mocks.create.assert_called_once_with(
+            100, 150, 75, main_mocks.fetch.return_value
+        )
 
-    @patch("scripts.fetch_downloads.fetch_download_data")
-    def test_main_fetch_failure(self, mock_fetch):
+    def test_main_fetch_failure(self, main_mocks):
         """Test main function with fetch failure."""
-        mock_fetch.return_value = None
-
-        result = main()
-        assert result == 1
-
-    @patch("scripts.fetch_downloads.fetch_download_data")
-    @patch("scripts.fetch_downloads.extract_monthly_downloads")
-    def test_main_extract_failure(self, mock_extract, mock_fetch):
-        """Test main function with monthly extraction failure."""
-        mock_fetch.return_value = {"downloads": {}}
-        mock_extract.return_value = None
+        main_mocks.fetch.return_value = None
 
         result = main()
         assert result == 1
+        main_mocks.extract.assert_not_called()
 
-    @patch("scripts.fetch_downloads.fetch_download_data")
-    @patch("scripts.fetch_downloads.extract_monthly_downloads")
-    @patch("scripts.fetch_downloads.extract_latest_30_days_downloads")
-    def test_main_extract_30d_failure(self, mock_extract_30d, mock_extract, mock_fetch):
-        """Test main function with 30-day extraction failure."""
-        mock_fetch.return_value = {"downloads": {}}
-        mock_extract.return_value = 100
-        mock_extract_30d.return_value = None
+    def test_main_extract_failure(self, main_mocks):
+        """Test main function with extraction failure."""
+        main_mocks.fetch.return_value = {"downloads": {}}
+        main_mocks.extract.return_value = None
 
         result = main()
         assert result == 1
+        main_mocks.create.assert_not_called()
 
-    @patch("scripts.fetch_downloads.fetch_download_data")
-    @patch("scripts.fetch_downloads.extract_monthly_downloads")
-    @patch("scripts.fetch_downloads.extract_latest_30_days_downloads")
-    @patch("scripts.fetch_downloads.extract_latest_7_days_downloads")
-    @patch("scripts.fetch_downloads.create_output_data")
-    @patch("scripts.fetch_downloads.save_yaml_data")
-    def test_main_save_failure(
-        self,
-        mock_save,
-        mock_create,
-        mock_extract_7d,
-        mock_extract_30d,
-        mock_extract,
-        mock_fetch,
-    ):
+    def test_main_save_failure(self, main_mocks):
         """Test main function with save failure."""
-        mock_fetch.return_value = {"downloads": {"2024-01-01": {"1.0": 100}}}
-        mock_extract.return_value = 100
-        mock_extract_30d.return_value = 150
-        mock_extract_7d.return_value = 75
-        mock_create.return_value = {"previous_month_downloads": 100}
-        mock_save.return_value = False
+        main_mocks.fetch.return_value = {"downloads": {"2024-01-01": {"1.0": 100}}}
+        main_mocks.extract.return_value = (100, 150, 75)
+        main_mocks.create.return_value = {"previous_month_downloads": 100}
+        main_mocks.save.return_value = False
 
         result = main()
         assert result == 1
@@ -654,12 +832,10 @@ class TestMain:
 class TestIntegration:
     """Integration tests for the complete workflow."""
 
-    @patch("scripts.fetch_downloads.requests.get")
-    def test_complete_workflow_success(self, mock_get):
+    def test_complete_workflow_success(self, mock_get, monkeypatch, tmp_path):
         """Test the complete workflow from API fetch to YAML save."""
         # Mock API response
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
+        get, mock_response = mock_get
         mock_response.json.return_value = {
             "total_downloads": 1000,
             "downloads": {
@@ -667,39 +843,28 @@ class TestIntegration:
                 "2024-01-16": {"1.0": 200, "1.1": 75},
             },
         }
-        mock_get.return_value = mock_response
-
-        with patch.dict(os.environ, {"PEPY_TECH_API_KEY": "test_key"}):
-            with patch(
-                "scripts.fetch_downloads.get_previous_month_dates"
-            ) as mock_dates:
-                mock_dates.return_value = (
-                    datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    datetime(2024, 1, 31, tzinfo=timezone.utc),
-                )
-
-                with patch(
-                    "scripts.fetch_downloads.get_last_30_days_dates"
-                ) as mock_30d_dates:
-                    mock_30d_dates.return_value = (
-                        datetime(2024, 1, 1, tzinfo=timezone.utc),
-                        datetime(2024, 1, 31, tzinfo=timezone.utc),
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+
+        for name, value in (
+            ("get_previous_month_dates", Mock(return_value=JAN_2024)),
+            ("get_last_30_days_dates", Mock(return_value=JAN_2024)),
+            (
+                "get_last_7_days_dates",
+                Mock(
+                    return_value=(
+                        datetime(2024, 1, 10, tzinfo=timezone.utc),
+                        datetime(2024, 1, 16, tzinfo=timezone.utc),
                     )
+                ),
+            ),
+            ("OUTPUT_FILE", tmp_path / "test_output.yaml"),
+        ):
+            monkeypatch.setattr(f"scripts.fetch_downloads.{name}", value)
+
+        result = main()
 
-                    with patch(
-                        "scripts.fetch_downloads.get_last_7_days_dates"
-                    ) as mock_7d_dates:
-                        mock_7d_dates.return_value = (
-                            datetime(2024, 1, 10, tzinfo=timezone.utc),
-                            datetime(2024, 1, 16, tzinfo=timezone.utc),
-                        )
-
-                        with patch(
-                            "scripts.fetch_downloads.OUTPUT_FILE",
-                            Path("/tmp/test_output.yaml"),
-                        ):
-                            result = main()
-
-                            assert result == 0
-                            # Verify the workflow executed all steps
-                            mock_get.assert_called_once()
+        assert result == 0
+        # Verify the workflow executed all steps
+        get.assert_called_once()
+        output = yaml.safe_load((tmp_path / "test_output.yaml").read_text())
+        assert output["previous_month_downloads"] == 425